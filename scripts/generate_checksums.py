@@ -6,32 +6,47 @@ This script generates repository manifests with file and folder checksums.
 """
 
 import sys
-import json
 import argparse
 from pathlib import Path
 
 # Add src to Python path  
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from midi_presets.checksum.manifest import ManifestGenerator
+from midi_presets.checksum.calculator import (
+    COMBINER_ALGORITHMS, DEFAULT_ALGORITHM, DEFAULT_COMBINER_ALGO, FILE_HASH_ALGORITHMS
+)
+from midi_presets.checksum.manifest import ManifestGenerator, save_manifest
+from midi_presets.utils.logging import LoggerSetup
 
 def main():
     parser = argparse.ArgumentParser(description='Generate and verify repository checksums')
     parser.add_argument('--verify', action='store_true', help='Verify existing checksums')
     parser.add_argument('--devices-folder', default='devices', help='Path to devices folder')
+    parser.add_argument('--no-cache', action='store_true', help='Rehash every file, ignoring the checksum cache')
+    parser.add_argument('--trust-cache', action='store_true',
+                        help='With --verify, accept cached hashes of files with unchanged mtime and size')
+    parser.add_argument('--algo', default=DEFAULT_ALGORITHM, choices=FILE_HASH_ALGORITHMS,
+                        help="Hash algorithm for file checksums (verify uses the manifest's)")
+    parser.add_argument('--combiner-algo', default=DEFAULT_COMBINER_ALGO, choices=sorted(COMBINER_ALGORITHMS),
+                        help='Hash used to combine file hashes into folder/repository checksums')
+    parser.add_argument('--compact', action='store_true', help='Write the manifest without indentation')
     
     args = parser.parse_args()
+    LoggerSetup.skip_record_details()
     
     devices_folder = Path(args.devices_folder)
     if not devices_folder.exists():
         print(f"❌ Devices folder not found: {devices_folder}")
         return 1
     
-    generator = ManifestGenerator(devices_folder)
+    generator = ManifestGenerator(
+        devices_folder, use_cache=not args.no_cache,
+        combiner_algo=args.combiner_algo, algorithm=args.algo
+    )
     manifest_path = devices_folder / "_manifest.json"
     
     if args.verify:
-        if generator.verify_manifest(manifest_path):
+        if generator.verify_manifest(manifest_path, trust_cache=args.trust_cache and not args.no_cache):
             print("✅ All checksums verified successfully")
             return 0
         else:
@@ -40,8 +55,7 @@ def main():
     else:
         manifest = generator.generate_manifest()
         
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+        save_manifest(manifest, manifest_path, compact=args.compact)
         
         print(f"✅ Repository manifest saved to {manifest_path}")
         print(f"📊 Repository checksum: {manifest['repository_checksum'][:16]}...")
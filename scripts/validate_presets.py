@@ -13,7 +13,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from midi_presets.cli.validate import ValidationCLI
+from midi_presets.utils.logging import LoggerSetup
 
 if __name__ == "__main__":
+    LoggerSetup.skip_record_details()
     cli = ValidationCLI()
     sys.exit(cli.run())
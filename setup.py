@@ -12,9 +12,14 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "blake3>=0.3.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0", 
+            "pytest-xdist>=3.3.0",
             "black>=23.7.0",
             "flake8>=6.0.0",
             "mypy>=1.5.0",
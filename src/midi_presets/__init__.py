@@ -7,13 +7,30 @@ A comprehensive system for managing, validating, and sharing MIDI device presets
 __version__ = "2.1.0"
 __author__ = "tirans"
 
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_imports
 from .utils.logging import LoggerSetup, get_logger
 from .utils.config import AppConfig, ValidationConfig
-from .models.device import DeviceModel
-from .validation.content import ContentValidator
-from .validation.security import SecurityValidator
-from .validation.business import BusinessRulesValidator
-from .validation.structure import StructureValidator
+
+# Models and validators pull in pydantic; they are imported on first access
+# so entry points that never touch them (e.g. checksum) start faster
+_LAZY_IMPORTS = {
+    "DeviceModel": ".models.device",
+    "ContentValidator": ".validation.content",
+    "SecurityValidator": ".validation.security",
+    "BusinessRulesValidator": ".validation.business",
+    "StructureValidator": ".validation.structure",
+}
+
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .models.device import DeviceModel
+    from .validation.content import ContentValidator
+    from .validation.security import SecurityValidator
+    from .validation.business import BusinessRulesValidator
+    from .validation.structure import StructureValidator
 
 __all__ = [
     "LoggerSetup",
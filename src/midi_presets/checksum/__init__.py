@@ -8,9 +8,12 @@ This package handles:
 """
 
 from .calculator import ChecksumCalculator
-from .manifest import ManifestGenerator
+from .manifest import ChecksumTable, ManifestGenerator, save_manifest, write_manifest
 
 __all__ = [
     "ChecksumCalculator",
-    "ManifestGenerator"
+    "ChecksumTable",
+    "ManifestGenerator",
+    "save_manifest",
+    "write_manifest"
 ]
@@ -1,53 +1,298 @@
 import hashlib
-import json
+import logging
+import mmap
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import time
 
+from ..utils import jsonio
 from ..utils.logging import get_logger
 
+MANIFEST_FILENAME = "_manifest.json"
+CACHE_FILENAME = ".checksum_cache.json"
+
+# Generated files that never take part in checksums
+EXCLUDED_FILENAMES = frozenset({MANIFEST_FILENAME, CACHE_FILENAME})
+
+# hashlib.file_digest is available from Python 3.11
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+# Files at least this large are hashed through mmap; below it the mapping
+# setup costs more than the read() copy it saves
+MMAP_THRESHOLD = 64 * 1024
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Hashes usable for the folder/repository combiner, independent of the file
+# hash algorithm. The combiner only detects changes, so a faster hash is a
+# valid choice.
+# All produce 32-byte digests, i.e. 64 hex characters.
+COMBINER_ALGORITHMS = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32),
+}
+if blake3 is not None:
+    COMBINER_ALGORITHMS["blake3"] = blake3.blake3
+
+DEFAULT_COMBINER_ALGO = "sha256"
+
+# Hashes usable for file checksums; the manifest records which one was used.
+# BLAKE3 is opt-in since it needs the blake3 package.
+FILE_HASH_ALGORITHMS = ("sha256", "blake3") if blake3 is not None else ("sha256",)
+
+DEFAULT_ALGORITHM = "sha256"
+
+
+def _combiner(algo: str):
+    """Return the hash constructor for a combiner algorithm"""
+    try:
+        return COMBINER_ALGORITHMS[algo]
+    except KeyError:
+        if algo == "blake3":
+            raise ValueError("Combiner algorithm 'blake3' requires the blake3 package")
+        raise ValueError(
+            f"Unknown combiner algorithm '{algo}', expected one of {sorted(COMBINER_ALGORITHMS)}"
+        )
+
+
+def relative_path_offset(base: Path) -> int:
+    """Length of the prefix to slice off ``str(path)`` to get a path relative to base
+    
+    Valid for paths built from ``base`` (e.g. ``base / name``), where slicing
+    avoids a ``relative_to`` call per file.
+    """
+    base_str = str(base)
+    if base_str == ".":
+        return 0
+    return len(os.path.join(base_str, ""))
+
+
+def combine_hash(chunks: Iterable[bytes], algo: str = DEFAULT_COMBINER_ALGO) -> str:
+    """Hex digest of the concatenated chunks, computed in one call
+    
+    Joining first keeps the per-entry work in C instead of one hashlib
+    update() call per chunk.
+    """
+    return _combiner(algo)(b"".join(chunks)).hexdigest()
+
+
+def _map_file(f) -> mmap.mmap:
+    """Read-only mapping of an open, non-empty file, hinted for sequential access"""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_json_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Recursively yield ``os.DirEntry`` objects for ``*.json`` files under root
+    
+    Symlinked directories are not followed, matching ``os.walk``.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry
+
+
 class ChecksumCalculator:
-    def __init__(self):
-        self.chunk_size = 4096
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        combiner_algo: str = DEFAULT_COMBINER_ALGO,
+        algorithm: str = DEFAULT_ALGORITHM
+    ):
+        self.chunk_size = 1024 * 1024
+        self.max_threads = 8
+        self.cache_file = Path(cache_file) if cache_file else None
+        _combiner(combiner_algo)
+        self.combiner_algo = combiner_algo
+        if algorithm not in FILE_HASH_ALGORITHMS:
+            if algorithm == "blake3":
+                raise ValueError("Hash algorithm 'blake3' requires the blake3 package")
+            raise ValueError(
+                f"Unknown hash algorithm '{algorithm}', expected one of {list(FILE_HASH_ALGORITHMS)}"
+            )
+        self.algorithm = algorithm
         self.logger = get_logger('checksum.calculator')
         
+        # path -> (mtime_ns, size, file hash)
+        self._hash_cache: Dict[str, Tuple[int, int, str]] = {}
+        if self.cache_file:
+            self.load_cache()
+        
         self.logger.info(
-            f"ChecksumCalculator initialized",
-            extra={'chunk_size': self.chunk_size}
+            "ChecksumCalculator initialized",
+            extra={
+                'chunk_size': self.chunk_size,
+                'algorithm': self.algorithm,
+                'combiner_algo': self.combiner_algo,
+                'cache_file': str(self.cache_file) if self.cache_file else None,
+                'cached_hashes': len(self._hash_cache)
+            }
         )
     
-    def calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a single file"""
-        start_time = time.time()
+    def load_cache(self):
+        """Load previously calculated file hashes from the cache file"""
+        try:
+            data = jsonio.load(self.cache_file)
+            
+            # Hashes from another algorithm are of no use
+            entries = data.get("entries", {}) if data.get("algorithm", "sha256") == self.algorithm else {}
+            
+            self._hash_cache = {
+                path: (int(mtime_ns), int(size), file_hash)
+                for path, (mtime_ns, size, file_hash) in entries.items()
+            }
+            self.logger.debug(
+                f"Loaded {len(self._hash_cache)} cached file hashes",
+                extra={'cache_file': str(self.cache_file)}
+            )
+            
+        except FileNotFoundError:
+            self._hash_cache = {}
+        except Exception as e:
+            # A broken cache only costs a rehash
+            self._hash_cache = {}
+            self.logger.warning(
+                f"Ignoring unreadable checksum cache: {e}",
+                extra={'cache_file': str(self.cache_file), 'error': str(e)}
+            )
+    
+    def save_cache(self, file_paths: Optional[Iterable[Path]] = None):
+        """Persist cached file hashes, optionally keeping only ``file_paths``"""
+        if not self.cache_file:
+            return
         
-        self.logger.debug(
-            f"Calculating file hash",
-            extra={'file_path': str(file_path)}
-        )
+        entries = self._hash_cache
+        if file_paths is not None:
+            keep = {str(f) for f in file_paths}
+            entries = {path: entry for path, entry in entries.items() if path in keep}
         
-        sha256_hash = hashlib.sha256()
-        bytes_processed = 0
+        try:
+            # Written through a temporary file so an interrupted run never
+            # leaves a truncated cache behind
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=self.cache_file.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(jsonio.dumps({"version": 1, "algorithm": self.algorithm, "entries": entries}))
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            self.logger.debug(
+                f"Saved {len(entries)} cached file hashes",
+                extra={'cache_file': str(self.cache_file)}
+            )
+            
+        except Exception as e:
+            self.logger.warning(
+                f"Could not save checksum cache: {e}",
+                extra={'cache_file': str(self.cache_file), 'error': str(e)}
+            )
+    
+    def remember_hash(self, file_path: Path, mtime_ns: int, size: int, file_hash: str):
+        """Record a hash calculated elsewhere for the given file state"""
+        self._hash_cache[str(file_path)] = (mtime_ns, size, file_hash)
+    
+    def get_cache_entry(self, file_path: Path) -> Optional[Tuple[int, int, str]]:
+        """Return the raw ``(mtime_ns, size, hash)`` cache entry for a file"""
+        return self._hash_cache.get(str(file_path))
+    
+    def get_cached_hash(self, file_path: Path, st: os.stat_result) -> Optional[str]:
+        """Return the cached hash if the file is unchanged since it was hashed"""
+        entry = self._hash_cache.get(str(file_path))
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+    
+    def calculate_file_hash(self, file_path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Calculate the hash of a single file with the configured algorithm
+        
+        A known ``st`` (e.g. from ``DirEntry.stat()``) lets cached files be
+        answered without opening them.
+        """
+        return self._hash_file(file_path, st)[1]
+    
+    def calculate_file_digest(self, file_path: Path, st: Optional[os.stat_result] = None) -> bytes:
+        """Calculate the raw 32-byte digest of a single file"""
+        digest, file_hash = self._hash_file(file_path, st)
+        return digest if digest is not None else bytes.fromhex(file_hash)
+    
+    def _hash_file(self, file_path: Path, st: Optional[os.stat_result]) -> Tuple[Optional[bytes], str]:
+        """Return ``(raw digest, hex hash)`` of a file
+        
+        The digest is None when the hash came from the cache; a freshly
+        hashed file is hex-encoded once, for the cache.
+        """
+        start_time = time.time()
+        
+        if st is not None:
+            cached_hash = self.get_cached_hash(file_path, st)
+            if cached_hash is not None:
+                return None, cached_hash
         
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(self.chunk_size), b""):
-                    sha256_hash.update(chunk)
-                    bytes_processed += len(chunk)
+                st = os.fstat(f.fileno())
+                bytes_processed = st.st_size
+                
+                cached_hash = self.get_cached_hash(file_path, st)
+                if cached_hash is not None:
+                    return None, cached_hash
+                
+                if self.algorithm == "blake3":
+                    hasher = blake3.blake3()
+                    if hasattr(hasher, "update_mmap"):
+                        # blake3 >= 0.4 hashes the mapped file without Python buffers
+                        hasher.update_mmap(file_path)
+                    elif st.st_size >= MMAP_THRESHOLD:
+                        with _map_file(f) as mm:
+                            hasher.update(mm)
+                    else:
+                        for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                            hasher.update(chunk)
+                elif st.st_size >= MMAP_THRESHOLD:
+                    # Hash the page cache in place, without copying into read() buffers
+                    with _map_file(f) as mm:
+                        hasher = hashlib.sha256(mm)
+                elif _HAS_FILE_DIGEST:
+                    # Hand the whole file to OpenSSL so it can use SHA-NI/ARMv8 SHA
+                    hasher = hashlib.file_digest(f, "sha256")
+                else:
+                    hasher = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                        hasher.update(chunk)
             
-            file_hash = sha256_hash.hexdigest()
-            duration = (time.time() - start_time) * 1000
+            digest = hasher.digest()
+            file_hash = digest.hex()
+            self.remember_hash(file_path, st.st_mtime_ns, st.st_size, file_hash)
             
-            self.logger.info(
-                f"File hash calculated",
-                extra={
-                    'file_path': str(file_path),
-                    'file_hash': file_hash[:16] + '...',
-                    'bytes_processed': bytes_processed,
-                    'duration_ms': duration
-                }
-            )
+            # Per-file logging is debug-only; callers report totals
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "File hash calculated",
+                    extra={
+                        'file_path': str(file_path),
+                        'file_hash': file_hash,
+                        'bytes_processed': bytes_processed,
+                        'duration_ms': (time.time() - start_time) * 1000
+                    }
+                )
             
-            return file_hash
+            return digest, file_hash
             
         except Exception as e:
             duration = (time.time() - start_time) * 1000
@@ -62,75 +307,112 @@ class ChecksumCalculator:
             )
             raise ValueError(f"Error calculating hash for {file_path}: {e}")
     
-    def calculate_folder_hash(self, folder_path: Path, exclude_patterns: List[str] = None) -> str:
-        """Calculate SHA256 hash of folder contents"""
+    def hash_bytes(self, buf: bytes) -> str:
+        """Calculate the hash of an in-memory buffer"""
+        if self.algorithm == "blake3":
+            return blake3.blake3(buf).hexdigest()
+        return hashlib.sha256(buf).hexdigest()
+    
+    def calculate_folder_hash(
+        self,
+        folder_path: Path,
+        exclude_patterns: List[str] = None,
+        file_hashes: Optional[Dict[Path, str]] = None,
+        files: Optional[List[Path]] = None
+    ) -> str:
+        """Calculate hash of folder contents using the combiner algorithm
+        
+        The folder hash covers, for each file in path order, the file system
+        encoding of its relative path followed by its raw file digest.
+        ``file_hashes`` maps file paths to already known hex file hashes;
+        those files are not read again. ``files`` is an already filtered,
+        sorted list of the folder's JSON files, which skips the folder walk.
+        """
         start_time = time.time()
         
         if exclude_patterns is None:
-            exclude_patterns = ["_manifest.json"]
-        
-        self.logger.info(
-            f"Calculating folder hash",
-            extra={
-                'folder_path': str(folder_path),
-                'exclude_patterns': exclude_patterns
-            }
-        )
+            exclude_patterns = list(EXCLUDED_FILENAMES)
         
-        sha256_hash = hashlib.sha256()
+        payload: List[bytes] = []
         files_processed = 0
         total_bytes = 0
         
-        # Get all JSON files sorted for consistent hashing
-        json_files = sorted([
-            f for f in folder_path.rglob("*.json")
-            if not any(pattern in f.name for pattern in exclude_patterns)
-        ])
-        
-        self.logger.debug(
-            f"Found {len(json_files)} JSON files to process",
-            extra={
-                'folder_path': str(folder_path),
-                'file_count': len(json_files),
-                'files': [str(f.relative_to(folder_path)) for f in json_files[:10]]  # Log first 10
+        if files is None:
+            # Get all JSON files sorted for consistent hashing, keeping the
+            # scandir entries so their stat results are reused below
+            file_entries = {
+                Path(entry.path): entry for entry in iter_json_entries(folder_path)
+                if not any(pattern in entry.name for pattern in exclude_patterns)
             }
-        )
+            json_files = sorted(file_entries)
+            stat = lambda file_path: file_entries[file_path].stat()
+        else:
+            json_files = files
+            stat = os.stat
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(
+                f"Found {len(json_files)} JSON files to process",
+                extra={
+                    'folder_path': str(folder_path),
+                    'file_count': len(json_files),
+                    'exclude_patterns': exclude_patterns
+                }
+            )
+        
+        # Known and cached hashes are used directly; the remaining files are
+        # read and hashed on threads (hashlib releases the GIL while hashing)
+        file_stats = {}
+        file_digests: Dict[Path, bytes] = {}
+        pending_files = []
         
         for file_path in json_files:
-            try:
-                # Add relative path and file hash to folder hash
-                relative_path = file_path.relative_to(folder_path)
-                sha256_hash.update(str(relative_path).encode())
-                
-                file_hash = self.calculate_file_hash(file_path)
-                sha256_hash.update(file_hash.encode())
-                
-                files_processed += 1
-                total_bytes += file_path.stat().st_size
-                
+            st = file_stats[file_path] = stat(file_path)
+            file_hash = file_hashes.get(file_path) if file_hashes else None
+            if file_hash is None:
+                file_hash = self.get_cached_hash(file_path, st)
+            
+            if file_hash is None:
+                pending_files.append(file_path)
+            else:
+                file_digests[file_path] = bytes.fromhex(file_hash)
+        
+        if len(pending_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_threads, len(pending_files))) as executor:
+                file_digests.update(zip(
+                    pending_files,
+                    executor.map(lambda f: self.calculate_file_digest(f, file_stats[f]), pending_files)
+                ))
+        else:
+            for file_path in pending_files:
+                file_digests[file_path] = self.calculate_file_digest(file_path, file_stats[file_path])
+        
+        offset = relative_path_offset(folder_path)
+        
+        for file_path in json_files:
+            # Add relative path and file hash to folder hash
+            relative_path = str(file_path)[offset:]
+            file_digest = file_digests[file_path]
+            payload += (os.fsencode(relative_path), file_digest)
+            
+            files_processed += 1
+            total_bytes += file_stats[file_path].st_size
+            
+            if debug_enabled:
                 self.logger.debug(
                     f"Processed file {files_processed}/{len(json_files)}",
                     extra={
-                        'file_path': str(relative_path),
-                        'file_hash': file_hash[:16] + '...'
-                    }
-                )
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Error processing file in folder hash: {e}",
-                    extra={
-                        'file_path': str(file_path),
-                        'error': str(e)
+                        'file_path': relative_path,
+                        'file_hash': file_digest.hex()
                     }
                 )
-                raise
         
-        folder_hash = sha256_hash.hexdigest()
+        folder_hash = combine_hash(payload, self.combiner_algo)
         duration = (time.time() - start_time) * 1000
         
         self.logger.info(
-            f"Folder hash calculated successfully",
+            "Folder hash calculated successfully",
             extra={
                 'folder_path': str(folder_path),
                 'folder_hash': folder_hash[:16] + '...',
@@ -142,48 +424,78 @@ class ChecksumCalculator:
         
         return folder_hash
     
-    def calculate_repository_hash(self, devices_folder: Path) -> str:
-        """Calculate hash of entire repository content"""
+    def calculate_repository_hash(
+        self,
+        devices_folder: Path,
+        file_hashes: Optional[Dict[Path, str]] = None
+    ) -> str:
+        """Calculate hash of entire repository content
+        
+        Walks and hashes every device folder; when folder hashes are already
+        known, use combine_folder_hashes instead.
+        """
         start_time = time.time()
         
         self.logger.info(
-            f"Calculating repository hash",
+            "Calculating repository hash",
             extra={'devices_folder': str(devices_folder)}
         )
         
-        sha256_hash = hashlib.sha256()
+        folder_checksums: Dict[str, str] = {}
         folders_processed = 0
         
-        # Get all device folders
-        device_folders = sorted([
-            f for f in devices_folder.iterdir()
-            if f.is_dir() and any(f.rglob("*.json"))
-        ])
+        # Index the JSON files of every device folder in a single walk and
+        # sort once; calculate_folder_hash then works from the index
+        offset = relative_path_offset(devices_folder)
+        folder_index: Dict[str, List[Path]] = {}
+        indexed_files = []
         
-        self.logger.debug(
-            f"Found {len(device_folders)} device folders",
-            extra={
-                'devices_folder': str(devices_folder),
-                'folder_count': len(device_folders),
-                'folders': [f.name for f in device_folders]
-            }
-        )
+        for entry in iter_json_entries(devices_folder):
+            file_path = Path(entry.path)
+            relative_path = str(file_path)[offset:]
+            if os.sep not in relative_path:
+                continue
+            
+            # Folders holding only excluded files still get an (empty) hash
+            folder_name = relative_path.split(os.sep, 1)[0]
+            folder_index.setdefault(folder_name, [])
+            if not any(pattern in entry.name for pattern in EXCLUDED_FILENAMES):
+                indexed_files.append((file_path, folder_name))
+        
+        for file_path, folder_name in sorted(indexed_files):
+            folder_index[folder_name].append(file_path)
+        
+        folder_names = sorted(folder_index)
         
-        for folder in device_folders:
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(
+                f"Found {len(folder_names)} device folders",
+                extra={
+                    'devices_folder': str(devices_folder),
+                    'folder_count': len(folder_names),
+                    'folders': folder_names
+                }
+            )
+        
+        for folder_name in folder_names:
+            folder = devices_folder / folder_name
             try:
-                folder_hash = self.calculate_folder_hash(folder)
-                relative_path = folder.relative_to(devices_folder)
-                sha256_hash.update(f"{relative_path}:{folder_hash}".encode())
+                folder_hash = self.calculate_folder_hash(
+                    folder, file_hashes=file_hashes, files=folder_index[folder_name]
+                )
+                folder_checksums[folder_name] = folder_hash
                 
                 folders_processed += 1
                 
-                self.logger.debug(
-                    f"Processed folder {folders_processed}/{len(device_folders)}",
-                    extra={
-                        'folder_name': folder.name,
-                        'folder_hash': folder_hash[:16] + '...'
-                    }
-                )
+                if debug_enabled:
+                    self.logger.debug(
+                        f"Processed folder {folders_processed}/{len(folder_names)}",
+                        extra={
+                            'folder_name': folder_name,
+                            'folder_hash': folder_hash
+                        }
+                    )
                 
             except Exception as e:
                 self.logger.error(
@@ -195,11 +507,11 @@ class ChecksumCalculator:
                 )
                 raise
         
-        repo_hash = sha256_hash.hexdigest()
+        repo_hash = self.combine_folder_hashes(folder_checksums)
         duration = (time.time() - start_time) * 1000
         
         self.logger.info(
-            f"Repository hash calculated successfully",
+            "Repository hash calculated successfully",
             extra={
                 'devices_folder': str(devices_folder),
                 'repository_hash': repo_hash[:16] + '...',
@@ -210,29 +522,73 @@ class ChecksumCalculator:
         
         return repo_hash
     
-    def verify_file_hash(self, file_path: Path, expected_hash: str) -> bool:
-        """Verify a file's hash matches expected value"""
-        self.logger.debug(
-            f"Verifying file hash",
-            extra={
-                'file_path': str(file_path),
-                'expected_hash': expected_hash[:16] + '...'
-            }
+    def combine_folder_hashes(self, folder_checksums: Dict[str, str]) -> str:
+        """Combine folder hashes into the repository hash
+        
+        Only device folders (top-level, no path separator) take part, in
+        sorted order, each as ``"<folder>:<folder_hash>"``. Nested entries of
+        a manifest's ``folder_checksums`` are ignored.
+        """
+        return combine_hash(
+            (
+                f"{name}:{folder_checksums[name]}".encode()
+                for name in sorted(folder_checksums) if os.sep not in name
+            ),
+            self.combiner_algo
         )
+    
+    def verify_file(self, file_path: Path, expected_hash: str, expected_size: Optional[int] = None) -> bool:
+        """Verify a file against its expected size and hash
         
+        A size mismatch fails immediately without reading the file.
+        """
         try:
-            actual_hash = self.calculate_file_hash(file_path)
-            matches = actual_hash == expected_hash
-            
-            self.logger.info(
-                f"File hash verification {'passed' if matches else 'failed'}",
+            st = os.stat(file_path)
+        except OSError as e:
+            self.logger.error(
+                f"Error verifying file hash: {e}",
                 extra={
                     'file_path': str(file_path),
-                    'expected_hash': expected_hash[:16] + '...',
-                    'actual_hash': actual_hash[:16] + '...',
-                    'matches': matches
+                    'error': str(e)
                 }
             )
+            return False
+        
+        if expected_size is not None and st.st_size != expected_size:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "File size verification failed",
+                    extra={
+                        'file_path': str(file_path),
+                        'expected_size': expected_size,
+                        'actual_size': st.st_size
+                    }
+                )
+            return False
+        
+        return self.verify_file_hash(file_path, expected_hash, st)
+    
+    def verify_file_hash(
+        self,
+        file_path: Path,
+        expected_hash: str,
+        st: Optional[os.stat_result] = None
+    ) -> bool:
+        """Verify a file's hash matches expected value"""
+        try:
+            actual_hash = self.calculate_file_hash(file_path, st)
+            matches = actual_hash == expected_hash
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"File hash verification {'passed' if matches else 'failed'}",
+                    extra={
+                        'file_path': str(file_path),
+                        'expected_hash': expected_hash,
+                        'actual_hash': actual_hash,
+                        'matches': matches
+                    }
+                )
             
             return matches
             
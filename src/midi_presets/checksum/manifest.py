@@ -1,23 +1,241 @@
-import json
+import logging
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any
+from itertools import repeat
+from typing import BinaryIO, Dict, Any, List, Optional, Tuple
 import time
 
-from .calculator import ChecksumCalculator
+from .calculator import (
+    CACHE_FILENAME, DEFAULT_ALGORITHM, DEFAULT_COMBINER_ALGO, EXCLUDED_FILENAMES, MANIFEST_FILENAME,
+    ChecksumCalculator, combine_hash, iter_json_entries, relative_path_offset
+)
+from ..utils import jsonio
 from ..utils.git import GitUtils
 from ..utils.logging import get_logger
 
+logger = get_logger('checksum.manifest')
+
+# Per-process calculator used by pool workers (see _init_worker)
+_worker_calculator: Optional[ChecksumCalculator] = None
+
+
+def _init_worker(cache_file: Optional[Path] = None, algorithm: str = DEFAULT_ALGORITHM):
+    """Create one ChecksumCalculator per worker process"""
+    global _worker_calculator
+    _worker_calculator = ChecksumCalculator(cache_file, algorithm=algorithm)
+
+
+def _analyze_file_worker(file_path: Path) -> Tuple[Dict[str, Any], Optional[Tuple[int, int, str]]]:
+    """Picklable entry point for analyzing a file in a worker process
+    
+    The worker's hash cache entry is returned too so the parent can persist it.
+    """
+    result = analyze_file(file_path, _worker_calculator)
+    return result, _worker_calculator.get_cache_entry(file_path)
+
+
+def analyze_file(file_path: Path, calculator: ChecksumCalculator) -> Dict[str, Any]:
+    """Analyze individual JSON file
+    
+    The file hash is stored under the calculator's algorithm name.
+    """
+    try:
+        file_start_time = time.time()
+        
+        # Read once: the same bytes feed both the JSON parser and the hasher
+        with open(file_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            buf = f.read()
+        data = jsonio.loads(buf)
+        
+        metadata = data.get("_metadata", {})
+        manufacturer = data.get("device_info", {}).get("manufacturer", "unknown")
+        
+        # Count presets
+        preset_count = 0
+        collections_info = {}
+        
+        for collection_name, collection_data in data.get("preset_collections", {}).items():
+            collection_presets = len(collection_data.get("presets", []))
+            preset_count += collection_presets
+            collections_info[collection_name] = collection_presets
+        
+        # Calculate file hash unless the file is unchanged since the last run
+        file_hash = calculator.get_cached_hash(file_path, st)
+        if file_hash is None:
+            file_hash = calculator.hash_bytes(buf)
+            calculator.remember_hash(file_path, st.st_mtime_ns, st.st_size, file_hash)
+        
+        result = {
+            calculator.algorithm: file_hash,
+            "size_bytes": len(buf),
+            "last_modified": metadata.get("modified_date"),
+            "schema_version": metadata.get("schema_version", "unknown"),
+            "file_revision": metadata.get("file_revision", 1),
+            "preset_count": preset_count,
+            "validation_status": "passed",
+            "manufacturer": manufacturer
+        }
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "File analysis completed",
+                extra={
+                    'file_path': str(file_path),
+                    'file_hash': file_hash,
+                    'preset_count': preset_count,
+                    'collections': collections_info,
+                    'schema_version': result["schema_version"],
+                    'duration_ms': (time.time() - file_start_time) * 1000
+                }
+            )
+        
+        return result
+        
+    except Exception as e:
+        logger.error(
+            f"Error analyzing file: {e}",
+            extra={
+                'file_path': str(file_path),
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+        )
+        
+        # Return basic info even on error
+        try:
+            file_hash = calculator.calculate_file_hash(file_path)
+            file_size = file_path.stat().st_size
+        except:
+            file_hash = "error_calculating_hash"
+            file_size = 0
+        
+        return {
+            calculator.algorithm: file_hash,
+            "size_bytes": file_size,
+            "last_modified": None,
+            "schema_version": "unknown",
+            "file_revision": 0,
+            "preset_count": 0,
+            "validation_status": "failed",
+            "error": str(e)
+        }
+
+
+def _indented(value: Any, level: int) -> bytes:
+    """Two-space indented JSON for a value nested ``level`` spaces deep"""
+    # JSON strings never contain raw newlines, so this only touches layout
+    return jsonio.dumps(value, indent=True).replace(b"\n", b"\n" + b" " * level)
+
+
+def write_manifest(manifest: Dict[str, Any], fp: BinaryIO, compact: bool = False):
+    """Write a manifest to a binary file, one section and file entry at a time
+    
+    The output is byte-identical to ``json.dump(manifest, fp, indent=2)``
+    (or compact separators) with ``ensure_ascii=False``, without first
+    building the whole document in memory.
+    """
+    if compact:
+        newline, pad, entry_pad, key_sep = b"", b"", b"", b":"
+        encode = lambda value, level: jsonio.dumps(value)
+    else:
+        newline, pad, entry_pad, key_sep = b"\n", b"  ", b"    ", b": "
+        encode = _indented
+    
+    fp.write(b"{")
+    for i, (key, value) in enumerate(manifest.items()):
+        fp.write((b"," if i else b"") + newline + pad + jsonio.dumps(key) + key_sep)
+        
+        if key == "file_checksums" and value:
+            for j, (file_path, file_info) in enumerate(value.items()):
+                fp.write(
+                    (b"," if j else b"{") + newline + entry_pad
+                    + jsonio.dumps(file_path) + key_sep + encode(file_info, 4)
+                )
+            fp.write(newline + pad + b"}")
+        else:
+            fp.write(encode(value, 2))
+    
+    fp.write(newline + b"}" if manifest else b"}")
+
+
+def save_manifest(manifest: Dict[str, Any], manifest_path: Path, compact: bool = False):
+    """Write a manifest file through a 64 KB buffer, keeping write() calls few"""
+    with open(manifest_path, "wb", buffering=64 * 1024) as f:
+        write_manifest(manifest, f, compact=compact)
+
+
+@dataclass
+class ChecksumTable:
+    """Column-wise view of a manifest's file checksums
+    
+    Keeps one list or array per field instead of a dict per file, which is
+    what verification iterates over. A size of -1 means none was recorded.
+    """
+    paths: List[str] = field(default_factory=list)
+    hashes: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    index: Dict[str, int] = field(default_factory=dict)
+    
+    @classmethod
+    def from_manifest(cls, file_checksums: Dict[str, Dict[str, Any]], hash_key: str) -> "ChecksumTable":
+        """Build the table from a manifest's ``file_checksums`` section"""
+        table = cls()
+        for file_path, file_info in file_checksums.items():
+            table.append(file_path, file_info.get(hash_key, ""), file_info.get("size_bytes"))
+        return table
+    
+    def append(self, file_path: str, file_hash: str, size: Optional[int] = None):
+        self.index[file_path] = len(self.paths)
+        self.paths.append(file_path)
+        self.hashes.append(file_hash)
+        self.sizes.append(-1 if size is None else size)
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self.index
+    
+    def find(self, file_hash: str) -> Optional[str]:
+        """Path of the first file with the given hash"""
+        try:
+            return self.paths[self.hashes.index(file_hash)]
+        except ValueError:
+            return None
+
+
 class ManifestGenerator:
-    def __init__(self, devices_folder: Path):
+    def __init__(
+        self,
+        devices_folder: Path,
+        jobs: Optional[int] = None,
+        use_cache: bool = True,
+        combiner_algo: str = DEFAULT_COMBINER_ALGO,
+        algorithm: str = DEFAULT_ALGORITHM
+    ):
         self.devices_folder = Path(devices_folder)
-        self.calculator = ChecksumCalculator()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_file = self.devices_folder / CACHE_FILENAME if use_cache else None
+        self.calculator = ChecksumCalculator(
+            self.cache_file, combiner_algo=combiner_algo, algorithm=algorithm
+        )
         self.git_utils = GitUtils()
-        self.logger = get_logger('checksum.manifest')
+        self.logger = logger
         
         self.logger.info(
-            f"ManifestGenerator initialized",
-            extra={'devices_folder': str(self.devices_folder)}
+            "ManifestGenerator initialized",
+            extra={
+                'devices_folder': str(self.devices_folder),
+                'jobs': self.jobs,
+                'use_cache': use_cache,
+                'algorithm': algorithm,
+                'combiner_algo': combiner_algo
+            }
         )
     
     def generate_manifest(self) -> Dict[str, Any]:
@@ -28,12 +246,14 @@ class ManifestGenerator:
         
         manifest = {
             "_repository_metadata": {
-                "manifest_version": "1.0.0",
+                "manifest_version": "1.1.0",
                 "generated_date": datetime.utcnow().isoformat() + "Z",
                 "repository_revision": self.git_utils.get_revision_count(),
                 "total_devices": 0,
                 "total_presets": 0,
-                "generator": "tirans/midi-device-presets-validator@2.1.0"
+                "generator": "tirans/midi-device-presets-validator@2.1.0",
+                "algorithm": self.calculator.algorithm,
+                "combiner_algo": self.calculator.combiner_algo
             },
             "file_checksums": {},
             "folder_checksums": {},
@@ -51,7 +271,7 @@ class ManifestGenerator:
         }
         
         self.logger.debug(
-            f"Initialized manifest structure",
+            "Initialized manifest structure",
             extra={'repository_revision': manifest["_repository_metadata"]["repository_revision"]}
         )
         
@@ -60,22 +280,29 @@ class ManifestGenerator:
         total_presets = 0
         processed_files = 0
         failed_files = 0
+        file_hashes: Dict[Path, str] = {}
+        hash_key = self.calculator.algorithm
         
-        json_files = list(self.devices_folder.rglob("*.json"))
-        json_files = [f for f in json_files if f.name != "_manifest.json"]
+        json_files = self._walk_json_files()
         
         self.logger.info(
             f"Found {len(json_files)} JSON files to process",
             extra={'file_count': len(json_files)}
         )
         
+        # Only files changed since the previous manifest are read and parsed
+        reused_entries = self._reusable_entries(json_files)
+        pending_files = [f for f in json_files if f not in reused_entries]
+        analyzed_entries = dict(zip(pending_files, self._analyze_files(pending_files)))
+        offset = relative_path_offset(self.devices_folder)
+        
         for json_file in json_files:
             try:
-                self.logger.debug(f"Processing file: {json_file}")
-                
-                relative_path = str(json_file.relative_to(self.devices_folder))
-                file_info = self._analyze_file(json_file)
+                file_info = reused_entries.get(json_file) or analyzed_entries[json_file]
+                relative_path = str(json_file)[offset:]
                 manifest["file_checksums"][relative_path] = file_info
+                if file_info[hash_key] != "error_calculating_hash":
+                    file_hashes[json_file] = file_info[hash_key]
                 
                 if file_info.get("validation_status") == "passed":
                     total_devices += 1
@@ -85,7 +312,7 @@ class ManifestGenerator:
                     failed_files += 1
                 
                 # Update statistics
-                self._update_statistics(manifest["statistics"], file_info, json_file)
+                self._update_statistics(manifest["statistics"], file_info)
                 
                 if processed_files % 10 == 0:  # Log progress every 10 files
                     self.logger.info(
@@ -108,13 +335,12 @@ class ManifestGenerator:
                     }
                 )
         
-        # Calculate folder checksums
-        self.logger.info("Calculating folder checksums")
-        self._calculate_folder_checksums(manifest)
+        # Calculate folder and repository checksums
+        self.logger.info("Calculating folder and repository checksums")
+        self._calculate_folder_checksums(manifest, json_files, file_hashes)
         
-        # Calculate repository checksum
-        self.logger.info("Calculating repository checksum")
-        manifest["repository_checksum"] = self.calculator.calculate_repository_hash(self.devices_folder)
+        # Keep hashes of the files seen in this run for the next one
+        self.calculator.save_cache(json_files)
         
         # Update metadata
         manifest["_repository_metadata"]["total_devices"] = total_devices
@@ -123,7 +349,7 @@ class ManifestGenerator:
         duration = (time.time() - start_time) * 1000
         
         self.logger.info(
-            f"Repository manifest generation completed",
+            "Repository manifest generation completed",
             extra={
                 'total_devices': total_devices,
                 'total_presets': total_presets,
@@ -136,125 +362,169 @@ class ManifestGenerator:
         
         return manifest
     
-    def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
-        """Analyze individual JSON file"""
-        self.logger.debug(f"Analyzing file: {file_path}")
+    def _reusable_entries(self, json_files: List[Path]) -> Dict[Path, Dict[str, Any]]:
+        """Previous manifest entries for files unchanged since they were hashed
+        
+        A file counts as unchanged when the hash cache still matches its
+        mtime_ns and size and the cached hash equals the stored file hash.
+        """
+        manifest_path = self.devices_folder / MANIFEST_FILENAME
+        if self.cache_file is None or not manifest_path.exists():
+            return {}
         
         try:
-            file_start_time = time.time()
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            metadata = data.get("_metadata", {})
-            
-            # Count presets
-            preset_count = 0
-            collections_info = {}
-            
-            for collection_name, collection_data in data.get("preset_collections", {}).items():
-                collection_presets = len(collection_data.get("presets", []))
-                preset_count += collection_presets
-                collections_info[collection_name] = collection_presets
-            
-            # Calculate file hash
-            file_hash = self.calculator.calculate_file_hash(file_path)
-            
-            file_analysis_duration = (time.time() - file_start_time) * 1000
-            
-            result = {
-                "sha256": file_hash,
-                "size_bytes": file_path.stat().st_size,
-                "last_modified": metadata.get("modified_date"),
-                "schema_version": metadata.get("schema_version", "unknown"),
-                "file_revision": metadata.get("file_revision", 1),
-                "preset_count": preset_count,
-                "validation_status": "passed"
-            }
-            
-            self.logger.debug(
-                f"File analysis completed",
-                extra={
-                    'file_path': str(file_path),
-                    'file_hash': file_hash[:16] + '...',
-                    'preset_count': preset_count,
-                    'collections': collections_info,
-                    'schema_version': result["schema_version"],
-                    'duration_ms': file_analysis_duration
-                }
-            )
-            
-            return result
-            
+            prior_checksums = jsonio.load(manifest_path).get("file_checksums", {})
         except Exception as e:
-            self.logger.error(
-                f"Error analyzing file: {e}",
-                extra={
-                    'file_path': str(file_path),
-                    'error': str(e),
-                    'error_type': type(e).__name__
-                }
+            self.logger.warning(
+                f"Ignoring unreadable previous manifest: {e}",
+                extra={'manifest_path': str(manifest_path)}
             )
+            return {}
+        
+        reusable = {}
+        offset = relative_path_offset(self.devices_folder)
+        
+        for json_file in json_files:
+            entry = prior_checksums.get(str(json_file)[offset:])
+            
+            # Failed entries are re-analyzed to report the current error;
+            # entries from older manifests lack the manufacturer statistic
+            if not entry or entry.get("validation_status") != "passed" or "manufacturer" not in entry:
+                continue
             
-            # Return basic info even on error
             try:
-                file_hash = self.calculator.calculate_file_hash(file_path)
-                file_size = file_path.stat().st_size
-            except:
-                file_hash = "error_calculating_hash"
-                file_size = 0
+                st = json_file.stat()
+            except OSError:
+                continue
             
-            return {
-                "sha256": file_hash,
-                "size_bytes": file_size,
-                "last_modified": None,
-                "schema_version": "unknown",
-                "file_revision": 0,
-                "preset_count": 0,
-                "validation_status": "failed",
-                "error": str(e)
-            }
+            if (entry.get("size_bytes") == st.st_size
+                    and self.calculator.get_cached_hash(json_file, st) == entry.get(self.calculator.algorithm)):
+                reusable[json_file] = entry
+        
+        self.logger.info(
+            f"Reusing {len(reusable)} unchanged manifest entries",
+            extra={'reused': len(reusable), 'total': len(json_files)}
+        )
+        
+        return reusable
+    
+    def _analyze_files(self, json_files):
+        """Analyze files, spreading the work over a process pool when worthwhile"""
+        if self.jobs <= 1 or len(json_files) <= 1:
+            return (self._analyze_file(f) for f in json_files)
+        
+        workers = min(self.jobs, len(json_files))
+        self.logger.debug(f"Analyzing {len(json_files)} files with {workers} worker processes")
+        
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.cache_file, self.calculator.algorithm)
+        ) as executor:
+            for file_path, (file_info, cache_entry) in zip(
+                json_files, executor.map(_analyze_file_worker, json_files, chunksize=8)
+            ):
+                if cache_entry:
+                    self.calculator.remember_hash(file_path, *cache_entry)
+                results.append(file_info)
+        
+        return results
+    
+    def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
+        """Analyze individual JSON file"""
+        return analyze_file(file_path, self.calculator)
     
-    def _calculate_folder_checksums(self, manifest: Dict[str, Any]):
-        """Calculate checksums for all folders"""
+    def _walk_json_files(self) -> List[Path]:
+        """Collect all checksummed JSON files in one walk, in checksum order"""
+        json_files = [
+            Path(entry.path) for entry in iter_json_entries(self.devices_folder)
+            if entry.name not in EXCLUDED_FILENAMES
+        ]
+        
+        # Path ordering compares parts, which keeps the files of every folder
+        # in the same relative order that calculate_folder_hash uses
+        json_files.sort()
+        return json_files
+    
+    def _calculate_folder_checksums(
+        self,
+        manifest: Dict[str, Any],
+        json_files: List[Path],
+        file_hashes: Dict[Path, str]
+    ):
+        """Calculate all folder checksums and the repository checksum in one pass
+        
+        Each file extends the hash payload of every folder above it, producing
+        the same values as calculate_folder_hash without walking any subtree
+        again. The repository checksum is then combined from the results.
+        """
         self.logger.info("Starting folder checksum calculation")
         
+        root_depth = len(self.devices_folder.parts)
+        sep = os.fsencode(os.sep)
+        folder_payloads: Dict[Tuple[str, ...], List[bytes]] = {}
+        failed_folders = set()
+        
+        for file_path in json_files:
+            parts = file_path.parts[root_depth:]
+            file_hash = file_hashes.get(file_path)
+            file_digest = bytes.fromhex(file_hash) if file_hash is not None else None
+            
+            # Encode the path once; the path relative to each ancestor folder
+            # is the tail after one more separator
+            relative_bytes = os.fsencode(os.sep.join(parts))
+            offset = 0
+            
+            for depth in range(1, len(parts)):
+                offset = relative_bytes.index(sep, offset) + 1
+                folder = parts[:depth]
+                payload = folder_payloads.get(folder)
+                if payload is None:
+                    payload = folder_payloads[folder] = []
+                
+                if file_digest is None:
+                    failed_folders.add(folder)
+                    continue
+                
+                payload += (relative_bytes[offset:], file_digest)
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         folders_processed = 0
         
-        for folder in self.devices_folder.rglob("*"):
-            if folder.is_dir() and any(folder.rglob("*.json")):
-                try:
-                    relative_path = str(folder.relative_to(self.devices_folder))
-                    if relative_path == ".":
-                        relative_path = "devices"
-                    
-                    folder_hash = self.calculator.calculate_folder_hash(folder)
-                    manifest["folder_checksums"][relative_path] = folder_hash
-                    folders_processed += 1
-                    
-                    self.logger.debug(
-                        f"Folder checksum calculated",
-                        extra={
-                            'folder_path': relative_path,
-                            'folder_hash': folder_hash[:16] + '...'
-                        }
-                    )
-                    
-                except Exception as e:
-                    self.logger.error(
-                        f"Error calculating folder checksum: {e}",
-                        extra={
-                            'folder_path': str(folder),
-                            'error': str(e)
-                        }
-                    )
+        for folder, payload in folder_payloads.items():
+            relative_path = os.sep.join(folder)
+            
+            if folder in failed_folders:
+                self.logger.error(
+                    "Error calculating folder checksum: unreadable files",
+                    extra={'folder_path': relative_path}
+                )
+                continue
+            
+            folder_hash = combine_hash(payload, self.calculator.combiner_algo)
+            manifest["folder_checksums"][relative_path] = folder_hash
+            folders_processed += 1
+            
+            if debug_enabled:
+                self.logger.debug(
+                    "Folder checksum calculated",
+                    extra={
+                        'folder_path': relative_path,
+                        'folder_hash': folder_hash
+                    }
+                )
+        
+        if any(len(folder) == 1 for folder in failed_folders):
+            raise ValueError("Cannot calculate repository checksum: some files could not be hashed")
+        
+        # The repository checksum only needs the device folder hashes just computed
+        manifest["repository_checksum"] = self.calculator.combine_folder_hashes(manifest["folder_checksums"])
         
         self.logger.info(
-            f"Folder checksum calculation completed",
+            "Folder checksum calculation completed",
             extra={'folders_processed': folders_processed}
         )
     
-    def _update_statistics(self, stats: Dict[str, Any], file_info: Dict[str, Any], file_path: Path):
+    def _update_statistics(self, stats: Dict[str, Any], file_info: Dict[str, Any]):
         """Update statistics with file information"""
         # Update validation summary
         status = file_info.get("validation_status", "pending")
@@ -266,24 +536,32 @@ class ManifestGenerator:
             stats["schema_version_distribution"][schema_version] = 0
         stats["schema_version_distribution"][schema_version] += 1
         
-        # Try to extract manufacturer info for statistics
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            manufacturer = data.get("device_info", {}).get("manufacturer", "unknown")
+        # Manufacturer is only known for files that parsed
+        manufacturer = file_info.get("manufacturer")
+        if manufacturer is not None:
             if manufacturer not in stats["devices_by_manufacturer"]:
                 stats["devices_by_manufacturer"][manufacturer] = 0
             stats["devices_by_manufacturer"][manufacturer] += 1
-            
-        except Exception as e:
-            self.logger.debug(
-                f"Could not extract manufacturer info: {e}",
-                extra={'file_path': str(file_path)}
-            )
     
-    def verify_manifest(self, manifest_path: Path) -> bool:
-        """Verify existing manifest against current repository state"""
+    def _verify_entry(
+        self, calculator: ChecksumCalculator, file_path: str, expected_hash: str, expected_size: int
+    ) -> Optional[bool]:
+        """Verify one manifest entry; None means the file is missing"""
+        full_path = self.devices_folder / file_path
+        
+        if not full_path.exists():
+            return None
+        
+        return calculator.verify_file(
+            full_path, expected_hash, None if expected_size < 0 else expected_size
+        )
+    
+    def verify_manifest(self, manifest_path: Path, trust_cache: bool = False) -> bool:
+        """Verify existing manifest against current repository state
+        
+        Every file is rehashed unless ``trust_cache`` is set, in which case
+        cached hashes of files with unchanged mtime and size are accepted.
+        """
         self.logger.info(f"Verifying manifest: {manifest_path}")
         
         if not manifest_path.exists():
@@ -291,8 +569,17 @@ class ManifestGenerator:
             return False
         
         try:
-            with open(manifest_path, 'r') as f:
-                stored_manifest = json.load(f)
+            stored_manifest = jsonio.load(manifest_path)
+            
+            # Verify with the algorithm the manifest was generated with. The
+            # calculator used for generation is left as it is.
+            algorithm = stored_manifest.get("_repository_metadata", {}).get("algorithm", DEFAULT_ALGORITHM)
+            cache_file = self.cache_file if trust_cache else None
+            calculator = self.calculator
+            if algorithm != calculator.algorithm or cache_file != calculator.cache_file:
+                calculator = ChecksumCalculator(
+                    cache_file, combiner_algo=calculator.combiner_algo, algorithm=algorithm
+                )
             
             verification_results = {
                 'files_verified': 0,
@@ -301,45 +588,54 @@ class ManifestGenerator:
                 'extra_files': 0
             }
             
-            stored_checksums = stored_manifest.get("file_checksums", {})
+            stored_checksums = ChecksumTable.from_manifest(
+                stored_manifest.get("file_checksums", {}), calculator.algorithm
+            )
             
-            # Verify each file in stored manifest
-            for file_path, stored_info in stored_checksums.items():
-                full_path = self.devices_folder / file_path
-                
-                if not full_path.exists():
+            # Verify each file in stored manifest; hashing runs on threads
+            # since hashlib releases the GIL, results are reported in order
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                outcomes = list(executor.map(
+                    self._verify_entry, repeat(calculator),
+                    stored_checksums.paths, stored_checksums.hashes, stored_checksums.sizes
+                ))
+            
+            for file_path, outcome in zip(stored_checksums.paths, outcomes):
+                if outcome is None:
                     verification_results['missing_files'] += 1
                     self.logger.warning(
-                        f"Missing file referenced in manifest",
+                        "Missing file referenced in manifest",
                         extra={'file_path': file_path}
                     )
-                    continue
-                
-                if self.calculator.verify_file_hash(full_path, stored_info.get("sha256", "")):
+                elif outcome:
                     verification_results['files_verified'] += 1
                 else:
                     verification_results['files_failed'] += 1
                     self.logger.error(
-                        f"File hash verification failed",
+                        "File hash verification failed",
                         extra={'file_path': file_path}
                     )
             
-            # Check for extra files not in manifest
+            # Check for extra files not in manifest, walking the same way
+            # generation does
+            offset = relative_path_offset(self.devices_folder)
             current_files = set(
-                str(f.relative_to(self.devices_folder))
-                for f in self.devices_folder.rglob("*.json")
-                if f.name != "_manifest.json"
+                entry.path[offset:]
+                for entry in iter_json_entries(self.devices_folder)
+                if entry.name not in EXCLUDED_FILENAMES
             )
-            manifest_files = set(stored_checksums.keys())
-            extra_files = current_files - manifest_files
+            extra_files = current_files.difference(stored_checksums.index)
             verification_results['extra_files'] = len(extra_files)
             
             for extra_file in extra_files:
                 self.logger.warning(
-                    f"Extra file not in manifest",
+                    "Extra file not in manifest",
                     extra={'file_path': extra_file}
                 )
             
+            # Hashes calculated while verifying serve the next run
+            calculator.save_cache()
+            
             all_verified = (
                 verification_results['files_failed'] == 0 and
                 verification_results['missing_files'] == 0 and
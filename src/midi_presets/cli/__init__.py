@@ -7,10 +7,24 @@ This package provides CLI tools for:
 - Main CLI entry point
 """
 
-from .validate import ValidationCLI
-from .checksum import ChecksumCLI
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_imports
 from .main import main
 
+# Each CLI is imported on first access, so running one command does not
+# load the other's dependencies
+_LAZY_IMPORTS = {
+    "ValidationCLI": ".validate",
+    "ChecksumCLI": ".checksum",
+}
+
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .validate import ValidationCLI
+    from .checksum import ChecksumCLI
+
 __all__ = [
     "ValidationCLI",
     "ChecksumCLI", 
@@ -1,31 +1,45 @@
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from ..checksum.manifest import ManifestGenerator
+from ..checksum.calculator import (
+    COMBINER_ALGORITHMS, DEFAULT_ALGORITHM, DEFAULT_COMBINER_ALGO, FILE_HASH_ALGORITHMS
+)
+from ..checksum.manifest import ManifestGenerator, save_manifest
 from ..utils.logging import LoggerSetup, get_logger
 
 class ChecksumCLI:
     def __init__(self):
         self.logger = get_logger('cli.checksum')
     
-    def generate_checksums(self, devices_folder: Path) -> bool:
+    def generate_checksums(
+        self,
+        devices_folder: Path,
+        combiner_algo: str = DEFAULT_COMBINER_ALGO,
+        compact: bool = False,
+        use_cache: bool = True,
+        jobs: Optional[int] = None,
+        algorithm: str = DEFAULT_ALGORITHM
+    ) -> bool:
         """Generate repository checksums"""
         try:
             self.logger.info(f"Generating checksums for {devices_folder}")
             
-            generator = ManifestGenerator(devices_folder)
+            generator = ManifestGenerator(
+                devices_folder, jobs=jobs, use_cache=use_cache,
+                combiner_algo=combiner_algo, algorithm=algorithm
+            )
             manifest = generator.generate_manifest()
             
             manifest_path = devices_folder / "_manifest.json"
-            with open(manifest_path, "w") as f:
-                json.dump(manifest, f, indent=2)
+            save_manifest(manifest, manifest_path, compact=compact)
             
             self.logger.info(f"Manifest saved to {manifest_path}")
-            print(f"✅ Repository manifest saved to {manifest_path}")
-            print(f"📊 Repository checksum: {manifest['repository_checksum'][:16]}...")
+            sys.stdout.write(
+                f"✅ Repository manifest saved to {manifest_path}\n"
+                f"📊 Repository checksum: {manifest['repository_checksum'][:16]}...\n"
+            )
             
             return True
             
@@ -34,7 +48,7 @@ class ChecksumCLI:
             print(f"❌ Error generating checksums: {e}")
             return False
     
-    def verify_checksums(self, devices_folder: Path) -> bool:
+    def verify_checksums(self, devices_folder: Path, trust_cache: bool = False, jobs: Optional[int] = None) -> bool:
         """Verify existing checksums"""
         try:
             self.logger.info(f"Verifying checksums for {devices_folder}")
@@ -44,8 +58,8 @@ class ChecksumCLI:
                 print(f"❌ No manifest file found at {manifest_path}")
                 return False
             
-            generator = ManifestGenerator(devices_folder)
-            if generator.verify_manifest(manifest_path):
+            generator = ManifestGenerator(devices_folder, jobs=jobs, use_cache=trust_cache)
+            if generator.verify_manifest(manifest_path, trust_cache=trust_cache):
                 print("✅ All checksums verified successfully")
                 return True
             else:
@@ -62,6 +76,15 @@ class ChecksumCLI:
         parser = argparse.ArgumentParser(description='Generate and verify repository checksums')
         parser.add_argument('--verify', action='store_true', help='Verify existing checksums')
         parser.add_argument('--devices-folder', default='devices', help='Path to devices folder')
+        parser.add_argument('--algo', default=DEFAULT_ALGORITHM, choices=FILE_HASH_ALGORITHMS,
+                            help="Hash algorithm for file checksums (verify uses the manifest's)")
+        parser.add_argument('--combiner-algo', default=DEFAULT_COMBINER_ALGO, choices=sorted(COMBINER_ALGORITHMS),
+                            help='Hash used to combine file hashes into folder/repository checksums')
+        parser.add_argument('--compact', action='store_true', help='Write the manifest without indentation')
+        parser.add_argument('--no-cache', action='store_true', help='Rehash every file, ignoring the checksum cache')
+        parser.add_argument('--trust-cache', action='store_true',
+                            help='With --verify, accept cached hashes of files with unchanged mtime and size')
+        parser.add_argument('--jobs', type=int, help='Number of parallel workers (default: CPU count)')
         parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
         parser.add_argument('--log-file', type=Path, help='Log file path')
         parser.add_argument('--json-logs', action='store_true', help='Output logs in JSON format')
@@ -81,8 +104,14 @@ class ChecksumCLI:
             return 1
         
         if parsed_args.verify:
-            success = self.verify_checksums(devices_folder)
+            success = self.verify_checksums(
+                devices_folder, trust_cache=parsed_args.trust_cache and not parsed_args.no_cache,
+                jobs=parsed_args.jobs
+            )
         else:
-            success = self.generate_checksums(devices_folder)
+            success = self.generate_checksums(
+                devices_folder, parsed_args.combiner_algo, parsed_args.compact,
+                use_cache=not parsed_args.no_cache, jobs=parsed_args.jobs, algorithm=parsed_args.algo
+            )
         
         return 0 if success else 1
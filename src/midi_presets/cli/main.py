@@ -2,8 +2,6 @@ import argparse
 import sys
 from typing import List
 
-from .validate import ValidationCLI
-from .checksum import ChecksumCLI
 from ..utils.logging import LoggerSetup
 
 def main(args: List[str] = None) -> int:
@@ -19,6 +17,8 @@ def main(args: List[str] = None) -> int:
     validate_parser = subparsers.add_parser('validate', help='Validate preset files')
     validate_parser.add_argument('files', nargs='+', help='JSON files to validate')
     validate_parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    validate_parser.add_argument('--jobs', type=int, help='Number of worker processes (default: CPU count)')
+    validate_parser.add_argument('--skip-unchanged', action='store_true', help='Skip files unchanged since they last passed')
     validate_parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     validate_parser.add_argument('--log-file', help='Log file path')
     validate_parser.add_argument('--json-logs', action='store_true', help='Output logs in JSON format')
@@ -27,6 +27,13 @@ def main(args: List[str] = None) -> int:
     checksum_parser = subparsers.add_parser('checksum', help='Generate or verify checksums')
     checksum_parser.add_argument('--verify', action='store_true', help='Verify existing checksums')
     checksum_parser.add_argument('--devices-folder', default='devices', help='Path to devices folder')
+    checksum_parser.add_argument('--algo', help="Hash algorithm for file checksums (verify uses the manifest's)")
+    checksum_parser.add_argument('--combiner-algo', help='Hash used to combine file hashes into folder/repository checksums')
+    checksum_parser.add_argument('--compact', action='store_true', help='Write the manifest without indentation')
+    checksum_parser.add_argument('--no-cache', action='store_true', help='Rehash every file, ignoring the checksum cache')
+    checksum_parser.add_argument('--trust-cache', action='store_true',
+                                 help='With --verify, accept cached hashes of files with unchanged mtime and size')
+    checksum_parser.add_argument('--jobs', type=int, help='Number of parallel workers (default: CPU count)')
     checksum_parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     checksum_parser.add_argument('--log-file', help='Log file path')
     checksum_parser.add_argument('--json-logs', action='store_true', help='Output logs in JSON format')
@@ -38,26 +45,38 @@ def main(args: List[str] = None) -> int:
         return 1
     
     # Setup basic logging first
+    LoggerSetup.skip_record_details()
     LoggerSetup.setup_logging(level='INFO')
     
+    # Only the selected command's modules are imported
     if parsed_args.command == 'validate':
+        from .validate import ValidationCLI
         cli = ValidationCLI()
         return cli.run([
             '--log-level', parsed_args.log_level,
             *((['--log-file', parsed_args.log_file] if parsed_args.log_file else [])),
             *((['--json-logs'] if parsed_args.json_logs else [])),
             *((['--strict'] if parsed_args.strict else [])),
+            *((['--jobs', str(parsed_args.jobs)] if parsed_args.jobs else [])),
+            *((['--skip-unchanged'] if parsed_args.skip_unchanged else [])),
             *parsed_args.files
         ])
     
     elif parsed_args.command == 'checksum':
+        from .checksum import ChecksumCLI
         cli = ChecksumCLI()
         return cli.run([
             '--devices-folder', parsed_args.devices_folder,
             '--log-level', parsed_args.log_level,
             *((['--log-file', parsed_args.log_file] if parsed_args.log_file else [])),
             *((['--json-logs'] if parsed_args.json_logs else [])),
-            *((['--verify'] if parsed_args.verify else []))
+            *((['--verify'] if parsed_args.verify else [])),
+            *((['--algo', parsed_args.algo] if parsed_args.algo else [])),
+            *((['--combiner-algo', parsed_args.combiner_algo] if parsed_args.combiner_algo else [])),
+            *((['--compact'] if parsed_args.compact else [])),
+            *((['--no-cache'] if parsed_args.no_cache else [])),
+            *((['--trust-cache'] if parsed_args.trust_cache else [])),
+            *((['--jobs', str(parsed_args.jobs)] if parsed_args.jobs else []))
         ])
     
     return 1
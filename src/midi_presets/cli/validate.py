@@ -1,74 +1,266 @@
 import argparse
+import dataclasses
+import hashlib
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from ..validation.content import ContentValidator
-from ..validation.security import SecurityValidator
-from ..validation.business import BusinessRulesValidator
-from ..validation.structure import StructureValidator
+from .. import __version__
+from ..validation.base import ValidationError
+from ..validation.context import ValidationContext
+from ..utils import jsonio
 from ..utils.config import ValidationConfig
 from ..utils.logging import LoggerSetup, get_logger
 
+ValidationResult = Tuple[bool, List[ValidationError]]
+
+# Content hashes of files that passed, kept for --skip-unchanged
+VALIDATION_CACHE_FILENAME = ".validation-cache.json"
+
+# Source whose changes can change validation results
+_VALIDATION_SOURCE_DIRS = ("validation", "models")
+
+
+def _validation_fingerprint(config: ValidationConfig) -> str:
+    """Digest of everything besides a file's content that decides its result
+    
+    Cached results only apply while the package version, the validation
+    and model source and the validation settings are unchanged.
+    """
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update(jsonio.dumps(dataclasses.asdict(config)))
+    package_dir = Path(__file__).resolve().parent.parent
+    for source_dir in _VALIDATION_SOURCE_DIRS:
+        for source_file in sorted((package_dir / source_dir).glob("*.py")):
+            digest.update(source_file.name.encode())
+            digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+# Per-process validators used by pool workers (see _init_worker)
+_worker_validators: Optional[list] = None
+
+
+def _create_validators(config: ValidationConfig) -> list:
+    """Create the validator chain run against each file"""
+    # Imported here so loading the CLI does not load the validators and
+    # the models behind them
+    from ..validation.content import ContentValidator
+    from ..validation.security import SecurityValidator
+    from ..validation.business import BusinessRulesValidator
+    from ..validation.structure import StructureValidator
+    
+    return [
+        StructureValidator(),
+        ContentValidator(config.max_file_size_mb),
+        SecurityValidator(),
+        BusinessRulesValidator()
+    ]
+
+
+def _init_worker(config: ValidationConfig, log_setup: Optional[tuple] = None):
+    """Create one validator chain per worker process
+    
+    ``log_setup`` repeats the parent's logging setup; spawned workers do not
+    inherit its handlers.
+    """
+    global _worker_validators
+    if log_setup is not None:
+        LoggerSetup.setup_logging(*log_setup)
+    _worker_validators = _create_validators(config)
+
+
+def _validate_one(file_path: Path) -> ValidationResult:
+    """Picklable entry point for validating a file in a worker process"""
+    return validate_file(file_path, _worker_validators)
+
+
+def validate_file(file_path: Path, validators: list) -> ValidationResult:
+    """Run every validator against a file
+    
+    Returns the overall result and each validator's errors followed by its
+    warnings, in validator order.
+    """
+    file_valid = True
+    issues: List[ValidationError] = []
+    
+    # The file is read and parsed once for the whole chain
+    ctx = ValidationContext(file_path)
+    
+    for validator in validators:
+        validator.clear_errors()
+        
+        if not validator.validate(ctx):
+            file_valid = False
+        
+        issues.extend(validator.get_errors())
+        issues.extend(validator.get_warnings())
+    
+    return file_valid, issues
+
+
 class ValidationCLI:
-    def __init__(self, config: ValidationConfig = None):
+    def __init__(
+        self,
+        config: ValidationConfig = None,
+        jobs: Optional[int] = None,
+        skip_unchanged: bool = False,
+        cache_file: Path = Path(VALIDATION_CACHE_FILENAME)
+    ):
         self.config = config or ValidationConfig()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.skip_unchanged = skip_unchanged
+        self.cache_file = cache_file
         self.logger = get_logger('cli.validate')
         
-        self.validators = [
-            StructureValidator(),
-            ContentValidator(self.config.max_file_size_mb),
-            SecurityValidator(),
-            BusinessRulesValidator()
-        ]
+        self._validators: Optional[list] = None
+    
+    @property
+    def validators(self) -> list:
+        """Validator chain, created on first use
+        
+        Runs that hand all files to worker processes, or have no files,
+        never build the chain in this process.
+        """
+        if self._validators is None:
+            self._validators = _create_validators(self.config)
+        return self._validators
+    
+    def _validate_all(self, file_paths: List[Path]):
+        """Validate files in order, spreading the work over a process pool when worthwhile"""
+        if self.jobs <= 1 or len(file_paths) <= 1:
+            return (validate_file(f, self.validators) for f in file_paths)
+        
+        workers = min(self.jobs, len(file_paths))
+        self.logger.debug(f"Validating {len(file_paths)} files with {workers} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(self.config, LoggerSetup.current_setup())
+        ) as executor:
+            return list(executor.map(_validate_one, file_paths))
+    
+    def _load_validation_cache(self, fingerprint: str) -> Dict[str, Dict]:
+        """Load the path -> {hash, valid, warnings} entries of previous runs
+        
+        Entries written with a different validation fingerprint are dropped.
+        """
+        try:
+            cache = jsonio.load(self.cache_file)
+            if cache.get("fingerprint") != fingerprint:
+                self.logger.info("Validation settings or code changed, ignoring validation cache")
+                return {}
+            return cache.get("entries", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            # A broken cache only means everything is validated again
+            self.logger.warning(f"Ignoring unreadable validation cache: {e}")
+            return {}
+    
+    def _save_validation_cache(self, entries: Dict[str, Dict], fingerprint: str):
+        """Write the cache through a temporary file so readers never see it half written"""
+        cache_dir = self.cache_file.parent
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=self.cache_file.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(jsonio.dumps({"version": 2, "fingerprint": fingerprint, "entries": entries}))
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.warning(f"Could not save validation cache: {e}")
+    
+    @staticmethod
+    def _content_hash(file_path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
     
     def validate_files(self, file_paths: List[Path]) -> bool:
-        """Validate multiple files"""
+        """Validate multiple files
+        
+        With ``skip_unchanged``, files whose content is identical to a
+        previous run in which they passed, under the same validation
+        settings and code, are not validated again; their warnings from
+        that run are reported again.
+        """
         self.logger.info(f"Starting validation of {len(file_paths)} files")
         
         all_valid = True
         total_errors = 0
         total_warnings = 0
+        skipped_files = 0
+        
+        if self.skip_unchanged:
+            fingerprint = _validation_fingerprint(self.config)
+            cache = self._load_validation_cache(fingerprint)
+            content_hashes = {f: self._content_hash(f) for f in file_paths}
+            pending_files = []
+            
+            for file_path in file_paths:
+                entry = cache.get(str(file_path))
+                file_hash = content_hashes[file_path]
+                if (file_hash is not None and entry is not None
+                        and entry.get("hash") == file_hash and entry.get("valid") is True):
+                    skipped_files += 1
+                    lines = [f"Validating {file_path}...", f"  ⏭️ {file_path.name} is unchanged, skipped"]
+                    for text in entry.get("warnings", []):
+                        lines.append(f"  {text}")
+                        total_warnings += 1
+                        self.logger.warning(text, extra={'file_path': file_path})
+                    sys.stdout.write("\n".join(lines) + "\n")
+                else:
+                    pending_files.append(file_path)
+        else:
+            pending_files = file_paths
         
-        for file_path in file_paths:
+        # Results arrive in input order, so output stays deterministic
+        for file_path, (file_valid, issues) in zip(pending_files, self._validate_all(pending_files)):
+            if self.skip_unchanged and content_hashes[file_path] is not None:
+                cache[str(file_path)] = {
+                    "hash": content_hashes[file_path],
+                    "valid": file_valid,
+                    "warnings": [str(issue) for issue in issues if issue.severity != "error"]
+                }
+            
             self.logger.info(f"Validating {file_path}")
-            print(f"Validating {file_path}...")
             
-            file_valid = True
+            # Each file's report goes to stdout in a single write
+            lines = [f"Validating {file_path}..."]
             file_errors = 0
             file_warnings = 0
             
-            for validator in self.validators:
-                validator.clear_errors()
-                
-                if not validator.validate(file_path):
-                    file_valid = False
-                
-                # Count and print errors
-                errors = validator.get_errors()
-                warnings = validator.get_warnings()
-                
-                file_errors += len(errors)
-                file_warnings += len(warnings)
-                
-                for error in errors:
-                    print(f"  {error}")
-                    self.logger.error(str(error), extra={'file_path': file_path})
-                
-                for warning in warnings:
-                    print(f"  {warning}")
-                    self.logger.warning(str(warning), extra={'file_path': file_path})
+            for issue in issues:
+                text = str(issue)
+                lines.append(f"  {text}")
+                if issue.severity == "error":
+                    file_errors += 1
+                    self.logger.error(text, extra={'file_path': file_path})
+                else:
+                    file_warnings += 1
+                    self.logger.warning(text, extra={'file_path': file_path})
             
             total_errors += file_errors
             total_warnings += file_warnings
             
             if file_valid:
-                print(f"  ✅ {file_path.name} is valid")
-                self.logger.info(f"File validation passed", extra={'file_path': file_path})
+                lines.append(f"  ✅ {file_path.name} is valid")
+            sys.stdout.write("\n".join(lines) + "\n")
+            
+            if file_valid:
+                self.logger.info("File validation passed", extra={'file_path': file_path})
             else:
                 all_valid = False
                 self.logger.error(
-                    f"File validation failed",
+                    "File validation failed",
                     extra={
                         'file_path': file_path,
                         'error_count': file_errors,
@@ -76,11 +268,16 @@ class ValidationCLI:
                     }
                 )
         
+        if self.skip_unchanged:
+            self._save_validation_cache(cache, fingerprint)
+            sys.stdout.write(f"\n⏭️ {skipped_files} skipped (unchanged)\n")
+        
         # Log summary
         self.logger.info(
-            f"Validation completed",
+            "Validation completed",
             extra={
                 'total_files': len(file_paths),
+                'skipped_files': skipped_files,
                 'total_errors': total_errors,
                 'total_warnings': total_warnings,
                 'all_valid': all_valid
@@ -94,6 +291,9 @@ class ValidationCLI:
         parser = argparse.ArgumentParser(description='Validate device preset JSON files')
         parser.add_argument('files', nargs='+', help='JSON files to validate')
         parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+        parser.add_argument('--jobs', type=int, help='Number of worker processes (default: CPU count)')
+        parser.add_argument('--skip-unchanged', action='store_true',
+                            help=f'Skip files unchanged since they last passed (cached in {VALIDATION_CACHE_FILENAME})')
         parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
         parser.add_argument('--log-file', type=Path, help='Log file path')
         parser.add_argument('--json-logs', action='store_true', help='Output logs in JSON format')
@@ -110,11 +310,17 @@ class ValidationCLI:
         if parsed_args.strict:
             self.config.strict_mode = True
         
+        if parsed_args.jobs:
+            self.jobs = parsed_args.jobs
+        
+        if parsed_args.skip_unchanged:
+            self.skip_unchanged = True
+        
         file_paths = [Path(f) for f in parsed_args.files]
         
         if self.validate_files(file_paths):
-            print("\n✅ All validations passed!")
+            sys.stdout.write("\n✅ All validations passed!\n")
             return 0
         else:
-            print("\n❌ Validation failed!")
+            sys.stdout.write("\n❌ Validation failed!\n")
             return 1
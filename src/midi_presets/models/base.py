@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import logging
+from pydantic import BaseModel, Field, model_validator
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -24,26 +25,30 @@ class BaseMetadataModel(BaseModel):
     created_date: datetime
     modified_date: datetime
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing BaseMetadataModel",
-            extra={
-                'created_date': data.get('created_date'),
-                'modified_date': data.get('modified_date')
-            }
-        )
-        super().__init__(**data)
+    @model_validator(mode='after')
+    def check_dates(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initialized BaseMetadataModel",
+                extra={
+                    'created_date': self.created_date,
+                    'modified_date': self.modified_date
+                }
+            )
 
         # Log validation of dates
         if self.created_date > self.modified_date:
             logger.warning(
                 "Created date is after modified date",
                 extra={
-                    'created_date': self.created_date.isoformat(),
-                    'modified_date': self.modified_date.isoformat()
+                    'created_date': self.created_date,
+                    'modified_date': self.modified_date
                 }
             )
+        return self
 
     class Config:
         validate_default = True
         extra = "forbid"
+        # Store status enums as their plain string values
+        use_enum_values = True
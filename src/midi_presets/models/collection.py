@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field, validator
+import logging
+import re
+from functools import cached_property
+from pydantic import BaseModel, Field, model_validator, validator
 from typing import Dict, List
 from .base import BaseMetadataModel, SyncStatus
 from .preset import PresetModel, PresetMetadataModel
@@ -6,6 +9,9 @@ from ..utils.logging import get_logger
 
 logger = get_logger('models.collection')
 
+_AUTHOR_INVALID_CHARS = ['<', '>', '"', "'", ';', '&']
+_AUTHOR_INVALID_RE = re.compile(r"""[<>"';&]""")
+
 class CollectionMetadataModel(BaseMetadataModel):
     name: str = Field(..., min_length=1, max_length=100)
     version: str = Field(..., pattern=r'^\d+\.\d+$')
@@ -17,44 +23,34 @@ class CollectionMetadataModel(BaseMetadataModel):
     parent_collections: List[str] = Field(default_factory=list)
     sync_status: SyncStatus = SyncStatus.SYNCED
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing CollectionMetadataModel",
-            extra={
-                'collection_name': data.get('name'),
-                'version': data.get('version'),
-                'revision': data.get('revision'),
-                'author': data.get('author'),
-                'preset_count': data.get('preset_count'),
-                'readonly': data.get('readonly', False)
-            }
-        )
-        super().__init__(**data)
-
-        logger.info(
-            f"Collection metadata created: {self.name}",
-            extra={
-                'collection_name': self.name,
-                'version': self.version,
-                'revision': self.revision,
-                'author': self.author,
-                'preset_count': self.preset_count,
-                'readonly': self.readonly,
-                'sync_status': self.sync_status,
-                'parent_collections': self.parent_collections
-            }
-        )
+    @model_validator(mode='after')
+    def log_collection_metadata(self):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Collection metadata created: {self.name}",
+                extra={
+                    'collection_name': self.name,
+                    'version': self.version,
+                    'revision': self.revision,
+                    'author': self.author,
+                    'preset_count': self.preset_count,
+                    'readonly': self.readonly,
+                    'sync_status': self.sync_status,
+                    'parent_collections': self.parent_collections
+                }
+            )
+        return self
 
     @validator('author')
     def validate_author(cls, v):
-        logger.debug(f"Validating author: {v}")
-        invalid_chars = ['<', '>', '"', "'", ';', '&']
-        if any(char in v for char in invalid_chars):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating author: {v}")
+        if _AUTHOR_INVALID_RE.search(v) is not None:
             logger.error(
-                f"Author contains invalid characters",
-                extra={'author': v, 'invalid_chars': invalid_chars}
+                "Author contains invalid characters",
+                extra={'author': v, 'invalid_chars': _AUTHOR_INVALID_CHARS}
             )
-            raise ValueError(f'Author contains invalid characters: {invalid_chars}')
+            raise ValueError(f'Author contains invalid characters: {_AUTHOR_INVALID_CHARS}')
         return v
 
 class PresetCollectionModel(BaseModel):
@@ -62,22 +58,9 @@ class PresetCollectionModel(BaseModel):
     presets: List[PresetModel] = Field(..., min_items=1, max_items=1000)
     preset_metadata: Dict[str, PresetMetadataModel]
 
-    def __init__(self, **data):
-        collection_name = data.get('metadata', {}).get('name', 'unknown')
-        presets_count = len(data.get('presets', []))
-
-        logger.info(
-            f"Initializing PresetCollectionModel: {collection_name}",
-            extra={
-                'collection_name': collection_name,
-                'presets_count': presets_count,
-                'metadata_count': len(data.get('preset_metadata', {}))
-            }
-        )
-
-        super().__init__(**data)
-
-        # Log collection statistics
+    @cached_property
+    def statistics(self) -> Dict[str, Dict[str, int]]:
+        """Preset counts by category, validation status and source"""
         categories = {}
         validation_statuses = {}
         sources = {}
@@ -97,29 +80,41 @@ class PresetCollectionModel(BaseModel):
                 source = preset_meta.source
                 sources[source] = sources.get(source, 0) + 1
 
-        logger.info(
-            f"Collection {self.metadata.name} loaded successfully",
-            extra={
-                'collection_name': self.metadata.name,
-                'total_presets': len(self.presets),
-                'categories': categories,
-                'validation_statuses': validation_statuses,
-                'sources': sources,
-                'readonly': self.metadata.readonly
-            }
-        )
+        return {
+            'categories': categories,
+            'validation_statuses': validation_statuses,
+            'sources': sources
+        }
+
+    @model_validator(mode='after')
+    def log_collection(self):
+        # Statistics are only counted when they get logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Collection {self.metadata.name} loaded successfully",
+                extra={
+                    'collection_name': self.metadata.name,
+                    'total_presets': len(self.presets),
+                    **self.statistics,
+                    'readonly': self.metadata.readonly
+                }
+            )
+        return self
 
     @validator('preset_metadata')
     def validate_preset_metadata_consistency(cls, v, values):
-        logger.debug(f"Validating metadata consistency for {len(v)} presets")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating metadata consistency for {len(v)} presets")
 
         if 'presets' not in values:
             return v
 
         preset_ids = {preset.preset_id for preset in values['presets']}
-        metadata_ids = set(v.keys())
 
-        if preset_ids != metadata_ids:
+        # The keys view compares against the set directly; the metadata id
+        # set and the differences are only built to report a mismatch
+        if v.keys() != preset_ids:
+            metadata_ids = set(v)
             missing = preset_ids - metadata_ids
             extra = metadata_ids - preset_ids
 
@@ -141,12 +136,14 @@ class PresetCollectionModel(BaseModel):
 
             raise ValueError("; ".join(errors))
 
-        logger.info("Preset metadata consistency validation passed")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Preset metadata consistency validation passed")
         return v
 
     @validator('metadata')
     def validate_preset_count(cls, v, values):
-        logger.debug(f"Validating preset count: expected {v.preset_count}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating preset count: expected {v.preset_count}")
 
         if 'presets' not in values:
             return v
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, validator
+import logging
+import re
+from pydantic import BaseModel, Field, model_validator, validator
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from .base import BaseMetadataModel
@@ -7,6 +9,12 @@ from ..utils.logging import get_logger
 
 logger = get_logger('models.device')
 
+_DEVICE_NAME_INVALID_CHARS = ['<', '>', '/', '\\', ':', '*', '?', '"', '|']
+_DEVICE_NAME_INVALID_RE = re.compile(r'[<>/\\:*?"|]')
+
+# Separators allowed in collection names, removed before the isalnum() check
+_COLLECTION_NAME_STRIP = str.maketrans('', '', '_-')
+
 class FileMetadataModel(BaseMetadataModel):
     schema_version: str = Field(..., pattern=r'^\d+\.\d+\.\d+$')
     file_revision: int = Field(..., ge=1)
@@ -15,19 +23,9 @@ class FileMetadataModel(BaseMetadataModel):
     migration_path: List[str] = Field(default_factory=list)
     compatibility: Dict[str, Any] = Field(default_factory=dict)
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing FileMetadataModel",
-            extra={
-                'schema_version': data.get('schema_version'),
-                'file_revision': data.get('file_revision'),
-                'created_by': data.get('created_by'),
-                'modified_by': data.get('modified_by')
-            }
-        )
-        super().__init__(**data)
-
-        if self.migration_path:
+    @model_validator(mode='after')
+    def log_migration_path(self):
+        if self.migration_path and logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"File has migration path with {len(self.migration_path)} versions",
                 extra={
@@ -35,6 +33,7 @@ class FileMetadataModel(BaseMetadataModel):
                     'current_version': self.schema_version
                 }
             )
+        return self
 
 class DeviceInfoModel(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -46,40 +45,31 @@ class DeviceInfoModel(BaseModel):
     midi_channels: Dict[str, int]
     midi_ports: Dict[str, str]
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing DeviceInfoModel",
-            extra={
-                'device_name': data.get('name'),
-                'manufacturer': data.get('manufacturer'),
-                'device_version': data.get('version'),
-                'manufacturer_id': data.get('manufacturer_id'),
-                'device_id': data.get('device_id')
-            }
-        )
-        super().__init__(**data)
-
-        logger.info(
-            f"Created device info for {self.name} v{self.version} by {self.manufacturer}",
-            extra={
-                'device_name': self.name,
-                'device_version': self.version,
-                'manufacturer': self.manufacturer,
-                'midi_ports': self.midi_ports,
-                'midi_channels': self.midi_channels
-            }
-        )
+    @model_validator(mode='after')
+    def log_device_info(self):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Created device info for {self.name} v{self.version} by {self.manufacturer}",
+                extra={
+                    'device_name': self.name,
+                    'device_version': self.version,
+                    'manufacturer': self.manufacturer,
+                    'midi_ports': self.midi_ports,
+                    'midi_channels': self.midi_channels
+                }
+            )
+        return self
 
     @validator('name')
     def validate_device_name(cls, v):
-        logger.debug(f"Validating device name: {v}")
-        invalid_chars = ['<', '>', '/', '\\', ':', '*', '?', '"', '|']
-        if any(char in v for char in invalid_chars):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating device name: {v}")
+        if _DEVICE_NAME_INVALID_RE.search(v) is not None:
             logger.error(
-                f"Device name contains invalid characters",
-                extra={'device_name': v, 'invalid_chars': invalid_chars}
+                "Device name contains invalid characters",
+                extra={'device_name': v, 'invalid_chars': _DEVICE_NAME_INVALID_CHARS}
             )
-            raise ValueError(f'Device name contains invalid characters: {invalid_chars}')
+            raise ValueError(f'Device name contains invalid characters: {_DEVICE_NAME_INVALID_CHARS}')
         return v
 
 class DeviceModel(BaseModel):
@@ -88,49 +78,44 @@ class DeviceModel(BaseModel):
     capabilities: Dict[str, Any] = Field(default_factory=dict)
     preset_collections: Dict[str, PresetCollectionModel] = Field(..., min_items=1)
 
-    def __init__(self, **data):
-        logger.info(
-            "Initializing DeviceModel",
-            extra={
-                'device_name': data.get('device_info', {}).get('name', 'unknown'),
-                'schema_version': data.get('_metadata', {}).get('schema_version', 'unknown'),
-                'collections_count': len(data.get('preset_collections', {}))
-            }
-        )
-        super().__init__(**data)
-
+    @model_validator(mode='after')
+    def log_device(self):
         # Log device summary
-        total_presets = sum(
-            len(collection.presets) 
-            for collection in self.preset_collections.values()
-        )
+        if logger.isEnabledFor(logging.INFO):
+            total_presets = sum(
+                len(collection.presets)
+                for collection in self.preset_collections.values()
+            )
 
-        logger.info(
-            f"Device model created successfully",
-            extra={
-                'device_name': self.device_info.name,
-                'manufacturer': self.device_info.manufacturer,
-                'schema_version': self.file_metadata.schema_version,
-                'file_revision': self.file_metadata.file_revision,
-                'total_collections': len(self.preset_collections),
-                'total_presets': total_presets,
-                'collection_names': list(self.preset_collections.keys())
-            }
-        )
+            logger.info(
+                "Device model created successfully",
+                extra={
+                    'device_name': self.device_info.name,
+                    'manufacturer': self.device_info.manufacturer,
+                    'schema_version': self.file_metadata.schema_version,
+                    'file_revision': self.file_metadata.file_revision,
+                    'total_collections': len(self.preset_collections),
+                    'total_presets': total_presets,
+                    'collection_names': list(self.preset_collections.keys())
+                }
+            )
+        return self
 
     @validator('preset_collections')
     def validate_preset_collections(cls, v):
-        logger.debug(f"Validating {len(v)} preset collections")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating {len(v)} preset collections")
 
         if not v:
             logger.error("No preset collections found")
             raise ValueError('At least one preset collection is required')
 
         for collection_name in v.keys():
-            logger.debug(f"Validating collection name: {collection_name}")
-            if not collection_name.replace('_', '').replace('-', '').isalnum():
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Validating collection name: {collection_name}")
+            if not collection_name.translate(_COLLECTION_NAME_STRIP).isalnum():
                 logger.error(
-                    f"Invalid collection name",
+                    "Invalid collection name",
                     extra={'collection_name': collection_name}
                 )
                 raise ValueError(f'Collection name "{collection_name}" contains invalid characters')
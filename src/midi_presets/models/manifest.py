@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, validator
+import logging
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, validator
 from typing import Dict, Any, Optional
 from datetime import datetime
 import re
@@ -7,80 +9,106 @@ from ..utils.logging import get_logger
 
 logger = get_logger('models.manifest')
 
+# 32-byte digest as lowercase hex; used with fullmatch, so no anchors
+_HEX_DIGEST_RE = re.compile(r'[a-f0-9]{64}')
+
+
+def _check_hex_digest(v: Optional[str]) -> Optional[str]:
+    if v is not None and _HEX_DIGEST_RE.fullmatch(v) is None:
+        raise ValueError('Checksum must be 64 lowercase hex characters')
+    return v
+
+
 class FileChecksumModel(BaseModel):
-    sha256: str = Field(..., pattern=r'^[a-f0-9]{64}$')
+    # The file hash is stored under the manifest's algorithm name
+    sha256: Optional[str] = None
+    blake3: Optional[str] = None
     size_bytes: int = Field(..., ge=0)
     last_modified: datetime
     schema_version: str
     file_revision: int = Field(..., ge=1)
     preset_count: int = Field(..., ge=0)
     validation_status: ValidationStatus
+    manufacturer: Optional[str] = None
     contributor: Optional[str] = None
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing FileChecksumModel",
-            extra={
-                'sha256': data.get('sha256', '')[:16] + '...',
-                'size_bytes': data.get('size_bytes'),
-                'schema_version': data.get('schema_version'),
-                'file_revision': data.get('file_revision'),
-                'preset_count': data.get('preset_count'),
-                'validation_status': data.get('validation_status')
-            }
-        )
-        super().__init__(**data)
+    # Store validation_status as its plain string value
+    model_config = ConfigDict(use_enum_values=True)
+
+    @field_validator('sha256', 'blake3')
+    @classmethod
+    def validate_hash_format(cls, v):
+        return _check_hex_digest(v)
+
+    @model_validator(mode='after')
+    def validate_file_hash(self):
+        if self.sha256 is None and self.blake3 is None:
+            raise ValueError('File checksum requires a sha256 or blake3 hash')
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initialized FileChecksumModel",
+                extra={
+                    'file_hash': self.file_hash[:16] + '...',
+                    'size_bytes': self.size_bytes,
+                    'schema_version': self.schema_version,
+                    'file_revision': self.file_revision,
+                    'preset_count': self.preset_count,
+                    'validation_status': self.validation_status
+                }
+            )
+        return self
+
+    @property
+    def file_hash(self) -> str:
+        """The file hash, whichever algorithm produced it"""
+        return self.sha256 or self.blake3
+
 
 class RepositoryManifestModel(BaseModel):
-    _repository_metadata: Dict[str, Any]
+    repository_metadata: Dict[str, Any] = Field(..., alias="_repository_metadata")
     file_checksums: Dict[str, FileChecksumModel]
     folder_checksums: Dict[str, str]
-    repository_checksum: str = Field(..., pattern=r'^[a-f0-9]{64}$')
+    repository_checksum: str
     statistics: Dict[str, Any]
 
-    def __init__(self, **data):
-        logger.info(
-            "Initializing RepositoryManifestModel",
-            extra={
-                'file_count': len(data.get('file_checksums', {})),
-                'folder_count': len(data.get('folder_checksums', {})),
-                'repository_checksum': data.get('repository_checksum', '')[:16] + '...'
-            }
-        )
-
-        super().__init__(**data)
+    model_config = ConfigDict(populate_by_name=True, ignored_types=(cached_property,))
 
+    @model_validator(mode='after')
+    def log_manifest(self):
         # Log repository statistics
-        stats = self.statistics
-        repo_meta = self._repository_metadata
-
-        logger.info(
-            "Repository manifest loaded successfully",
-            extra={
-                'manifest_version': repo_meta.get('manifest_version'),
-                'repository_revision': repo_meta.get('repository_revision'),
-                'total_devices': repo_meta.get('total_devices'),
-                'total_presets': repo_meta.get('total_presets'),
-                'file_checksums_count': len(self.file_checksums),
-                'folder_checksums_count': len(self.folder_checksums),
-                'repository_checksum': self.repository_checksum[:16] + '...',
-                'validation_summary': stats.get('validation_summary', {}),
-                'schema_distribution': stats.get('schema_version_distribution', {})
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            stats = self.statistics
+            repo_meta = self.repository_metadata
+
+            logger.info(
+                "Repository manifest loaded successfully",
+                extra={
+                    'manifest_version': repo_meta.get('manifest_version'),
+                    'repository_revision': repo_meta.get('repository_revision'),
+                    'total_devices': repo_meta.get('total_devices'),
+                    'total_presets': repo_meta.get('total_presets'),
+                    'file_checksums_count': len(self.file_checksums),
+                    'folder_checksums_count': len(self.folder_checksums),
+                    'repository_checksum': self.repository_checksum[:16] + '...',
+                    'validation_summary': stats.get('validation_summary', {}),
+                    'schema_distribution': stats.get('schema_version_distribution', {})
+                }
+            )
+        return self
 
     @validator('folder_checksums')
     def validate_folder_checksums(cls, v):
-        logger.debug(f"Validating {len(v)} folder checksums")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating {len(v)} folder checksums")
 
-        sha256_pattern = r'^[a-f0-9]{64}$'
         invalid_checksums = []
 
         for folder, checksum in v.items():
-            if not re.match(sha256_pattern, checksum):
+            if _HEX_DIGEST_RE.fullmatch(checksum) is None:
                 invalid_checksums.append((folder, checksum))
                 logger.error(
-                    f"Invalid checksum format for folder",
+                    "Invalid checksum format for folder",
                     extra={'folder': folder, 'checksum': checksum[:16] + '...'}
                 )
 
@@ -90,19 +118,30 @@ class RepositoryManifestModel(BaseModel):
         logger.info(f"All {len(v)} folder checksums validated successfully")
         return v
 
-    @validator('repository_checksum')
+    @field_validator('repository_checksum')
+    @classmethod
     def validate_repository_checksum(cls, v):
-        logger.debug(f"Validating repository checksum: {v[:16]}...")
-        return v
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating repository checksum: {v[:16]}...")
+        return _check_hex_digest(v)
+
+    @cached_property
+    def _checksum_index(self) -> Dict[str, str]:
+        """File hash -> path, keeping the first path for duplicate contents"""
+        index = {}
+        for file_path, file_info in self.file_checksums.items():
+            index.setdefault(file_info.file_hash, file_path)
+        return index
 
     def get_file_by_checksum(self, checksum: str) -> Optional[str]:
         """Find file by its checksum"""
-        logger.debug(f"Searching for file with checksum: {checksum[:16]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Searching for file with checksum: {checksum[:16]}...")
 
-        for file_path, file_info in self.file_checksums.items():
-            if file_info.sha256 == checksum:
-                logger.info(f"Found file: {file_path}")
-                return file_path
+        file_path = self._checksum_index.get(checksum)
+        if file_path is not None:
+            logger.info(f"Found file: {file_path}")
+            return file_path
 
         logger.warning(f"No file found with checksum: {checksum[:16]}...")
         return None
@@ -110,5 +149,6 @@ class RepositoryManifestModel(BaseModel):
     def get_validation_summary(self) -> Dict[str, int]:
         """Get validation status summary"""
         summary = self.statistics.get('validation_summary', {})
-        logger.debug(f"Validation summary: {summary}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validation summary: {summary}")
         return summary
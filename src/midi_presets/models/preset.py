@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, validator
+import logging
+import re
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from .base import BaseMetadataModel, ValidationStatus
@@ -6,6 +8,13 @@ from ..utils.logging import get_logger
 
 logger = get_logger('models.preset')
 
+_PRESET_NAME_INVALID_CHARS = ('<', '>', '{', '}', '\\', '/', ';', '"', "'")
+_PRESET_NAME_INVALID_RE = re.compile(r"""[<>{}\\/;"']""")
+
+# Same as stripping '_' and '-' and calling isalnum(): word characters and
+# hyphens with at least one letter or digit
+_PRESET_ID_RE = re.compile(r'[\w-]*[^\W_][\w-]*')
+
 class PresetMetadataModel(BaseMetadataModel):
     version: str = Field(..., pattern=r'^\d+\.\d+$')
     validation_status: ValidationStatus
@@ -13,18 +22,6 @@ class PresetMetadataModel(BaseMetadataModel):
     derived_from: Optional[str] = None
     midi_learn_source: Optional[str] = None
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing PresetMetadataModel",
-            extra={
-                'version': data.get('version'),
-                'validation_status': data.get('validation_status'),
-                'source': data.get('source'),
-                'derived_from': data.get('derived_from')
-            }
-        )
-        super().__init__(**data)
-
 class PresetModel(BaseModel):
     preset_id: str = Field(..., min_length=1, max_length=100)
     cc_0: Optional[int] = Field(None, ge=0, le=127)
@@ -37,85 +34,45 @@ class PresetModel(BaseModel):
     user_ratings: Dict[str, Any] = Field(default_factory=dict)
     usage_stats: Dict[str, Any] = Field(default_factory=dict)
 
-    def __init__(self, **data):
-        logger.debug(
-            "Initializing PresetModel",
-            extra={
-                'preset_id': data.get('preset_id'),
-                'preset_name': data.get('preset_name'),
-                'category': data.get('category'),
-                'pgm': data.get('pgm'),
-                'cc_0': data.get('cc_0')
-            }
-        )
-        super().__init__(**data)
+    # Presets are never modified after loading
+    model_config = ConfigDict(frozen=True)
 
-        logger.info(
-            f"Created preset: {self.preset_name}",
-            extra={
-                'preset_id': self.preset_id,
-                'preset_name': self.preset_name,
-                'category': self.category,
-                'pgm': self.pgm,
-                'cc_0': self.cc_0,
-                'characters_count': len(self.characters),
-                'has_performance_notes': bool(self.performance_notes.strip()),
-                'has_user_ratings': bool(self.user_ratings),
-                'has_usage_stats': bool(self.usage_stats)
-            }
-        )
-
-    @validator('preset_name')
+    @field_validator('preset_name')
+    @classmethod
     def validate_preset_name(cls, v):
-        logger.debug(f"Validating preset name: {v}")
-        invalid_chars = ['<', '>', '{', '}', '\\', '/', ';', '"', "'"]
-        if any(char in v for char in invalid_chars):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating preset name: %s", v)
+        if _PRESET_NAME_INVALID_RE.search(v) is not None:
+            invalid_chars = list(_PRESET_NAME_INVALID_CHARS)
             logger.error(
-                f"Preset name contains invalid characters",
+                "Preset name contains invalid characters",
                 extra={'preset_name': v, 'invalid_chars': invalid_chars}
             )
             raise ValueError(f'Preset name contains invalid characters: {invalid_chars}')
         return v
 
-    @validator('sendmidi_command')
+    @field_validator('sendmidi_command')
+    @classmethod
     def validate_sendmidi_command(cls, v):
-        logger.debug(f"Validating sendmidi command: {v[:50]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating sendmidi command: %.50s...", v)
         if not v.startswith('sendmidi'):
             logger.error(
-                f"Invalid sendmidi command format",
+                "Invalid sendmidi command format",
                 extra={'command_start': v[:20]}
             )
             raise ValueError('Command must start with "sendmidi"')
         return v
 
-    @validator('preset_id')
+    @field_validator('preset_id')
+    @classmethod
     def validate_preset_id(cls, v):
-        logger.debug(f"Validating preset ID: {v}")
-        if not v.replace('_', '').replace('-', '').isalnum():
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating preset ID: %s", v)
+        if _PRESET_ID_RE.fullmatch(v) is None:
             logger.error(
-                f"Invalid preset ID format",
+                "Invalid preset ID format",
                 extra={'preset_id': v}
             )
             raise ValueError('Preset ID must be alphanumeric with underscores/hyphens only')
         return v
-
-    @validator('pgm')
-    def validate_program_number(cls, v):
-        logger.debug(f"Validating program number: {v}")
-        if not (0 <= v <= 127):
-            logger.warning(
-                f"Program number outside MIDI range",
-                extra={'pgm': v}
-            )
-        return v
-
-    @validator('cc_0')
-    def validate_control_change(cls, v):
-        if v is not None:
-            logger.debug(f"Validating CC_0: {v}")
-            if not (0 <= v <= 127):
-                logger.warning(
-                    f"CC_0 value outside MIDI range",
-                    extra={'cc_0': v}
-                )
-        return v
@@ -5,11 +5,24 @@ This package provides:
 - Logging configuration and utilities
 - Configuration management
 - Git repository utilities
+- JSON encoding/decoding (orjson when installed)
 """
 
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_imports
 from .logging import LoggerSetup, get_logger, JSONFormatter
 from .config import AppConfig, ValidationConfig, ChecksumConfig, LoggingConfig
-from .git import GitUtils
+
+# The git helpers pull in subprocess; they are imported on first access
+_LAZY_IMPORTS = {
+    "GitUtils": ".git",
+}
+
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .git import GitUtils
 
 __all__ = [
     "LoggerSetup",
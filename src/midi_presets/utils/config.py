@@ -1,13 +1,47 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import logging
 import os
-import json
 
+from . import jsonio
 from .logging import get_logger
 
 logger = get_logger('utils.config')
 
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+def _parse_optional_path(value: Optional[str]) -> Optional[Path]:
+    # Unset and empty both mean no path
+    return Path(value) if value else None
+
+
+# (variable, section, field, parser, default) read by AppConfig.from_environment
+_ENV_SPEC = (
+    ('MIDI_DEVICES_FOLDER', None, 'devices_folder', Path, 'devices'),
+    ('MIDI_MAX_FILE_SIZE_MB', 'validation', 'max_file_size_mb', float, '3.0'),
+    ('MIDI_MAX_PRESETS_PER_COLLECTION', 'validation', 'max_presets_per_collection', int, '1000'),
+    ('MIDI_MAX_FOLDER_DEPTH', 'validation', 'max_folder_depth', int, '4'),
+    ('MIDI_STRICT_MODE', 'validation', 'strict_mode', _parse_bool, 'false'),
+    ('MIDI_LOG_LEVEL', 'logging', 'level', str, 'INFO'),
+    ('MIDI_JSON_LOGS', 'logging', 'json_format', _parse_bool, 'false'),
+    ('MIDI_LOG_FILE', 'logging', 'log_file', _parse_optional_path, None),
+)
+
+
+@lru_cache(maxsize=1)
+def _parse_environment(values: Tuple[Optional[str], ...]) -> Dict[Optional[str], Dict[str, Any]]:
+    """Parse the _ENV_SPEC variables' values into keyword arguments per config section"""
+    sections: Dict[Optional[str], Dict[str, Any]] = {None: {}, 'validation': {}, 'logging': {}}
+    for (_, section, name, parse, default), value in zip(_ENV_SPEC, values):
+        sections[section][name] = parse(default if value is None else value)
+    return sections
+
+
 @dataclass
 class ValidationConfig:
     max_file_size_mb: float = 3.0
@@ -17,30 +51,34 @@ class ValidationConfig:
     allowed_extensions: List[str] = field(default_factory=lambda: ['.json'])
     
     def __post_init__(self):
-        logger.debug(
-            "ValidationConfig initialized",
-            extra={
-                'max_file_size_mb': self.max_file_size_mb,
-                'max_presets_per_collection': self.max_presets_per_collection,
-                'max_folder_depth': self.max_folder_depth,
-                'strict_mode': self.strict_mode,
-                'allowed_extensions': self.allowed_extensions
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ValidationConfig initialized",
+                extra={
+                    'max_file_size_mb': self.max_file_size_mb,
+                    'max_presets_per_collection': self.max_presets_per_collection,
+                    'max_folder_depth': self.max_folder_depth,
+                    'strict_mode': self.strict_mode,
+                    'allowed_extensions': self.allowed_extensions
+                }
+            )
+
 
 @dataclass
 class ChecksumConfig:
     exclude_patterns: List[str] = field(default_factory=lambda: ["_manifest.json"])
-    chunk_size: int = 4096
+    chunk_size: int = 1024 * 1024
     
     def __post_init__(self):
-        logger.debug(
-            "ChecksumConfig initialized",
-            extra={
-                'exclude_patterns': self.exclude_patterns,
-                'chunk_size': self.chunk_size
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ChecksumConfig initialized",
+                extra={
+                    'exclude_patterns': self.exclude_patterns,
+                    'chunk_size': self.chunk_size
+                }
+            )
+
 
 @dataclass
 class LoggingConfig:
@@ -49,14 +87,16 @@ class LoggingConfig:
     log_file: Optional[Path] = None
     
     def __post_init__(self):
-        logger.debug(
-            "LoggingConfig initialized",
-            extra={
-                'level': self.level,
-                'json_format': self.json_format,
-                'log_file': str(self.log_file) if self.log_file else None
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "LoggingConfig initialized",
+                extra={
+                    'level': self.level,
+                    'json_format': self.json_format,
+                    'log_file': str(self.log_file) if self.log_file else None
+                }
+            )
+
 
 @dataclass
 class AppConfig:
@@ -70,26 +110,28 @@ class AppConfig:
         if isinstance(self.devices_folder, str):
             self.devices_folder = Path(self.devices_folder)
         
-        logger.info(
-            "AppConfig initialized",
-            extra={
-                'devices_folder': str(self.devices_folder),
-                'devices_folder_exists': self.devices_folder.exists(),
-                'validation_strict_mode': self.validation.strict_mode,
-                'logging_level': self.logging.level
-            }
-        )
+        # The existence check is a stat call, so only make it when logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "AppConfig initialized",
+                extra={
+                    'devices_folder': str(self.devices_folder),
+                    'devices_folder_exists': self.devices_folder.exists(),
+                    'validation_strict_mode': self.validation.strict_mode,
+                    'logging_level': self.logging.level
+                }
+            )
     
     @classmethod
     def from_file(cls, config_file: Path) -> 'AppConfig':
         """Load configuration from JSON file"""
-        logger.info(f"Loading configuration from file: {config_file}")
+        logger.info("Loading configuration from file: %s", config_file)
         
         try:
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            data = jsonio.load(config_file)
             
-            logger.debug(f"Configuration file loaded successfully")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Configuration file loaded successfully")
             
             # Parse nested configurations
             validation_data = data.get('validation', {})
@@ -104,24 +146,24 @@ class AppConfig:
             )
             
             logger.info(
-                f"Configuration loaded from file",
+                "Configuration loaded from file",
                 extra={'config_file': str(config_file)}
             )
             
             return config
             
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {config_file}")
+            logger.error("Configuration file not found: %s", config_file)
             raise
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             logger.error(
-                f"Invalid JSON in configuration file: {e}",
+                "Invalid JSON in configuration file: %s", e,
                 extra={'config_file': str(config_file), 'error': str(e)}
             )
             raise
         except Exception as e:
             logger.error(
-                f"Error loading configuration: {e}",
+                "Error loading configuration: %s", e,
                 extra={'config_file': str(config_file), 'error': str(e)}
             )
             raise
@@ -131,25 +173,15 @@ class AppConfig:
         """Load configuration from environment variables"""
         logger.info("Loading configuration from environment variables")
         
-        devices_folder = os.getenv('MIDI_DEVICES_FOLDER', 'devices')
-        
-        validation_config = ValidationConfig(
-            max_file_size_mb=float(os.getenv('MIDI_MAX_FILE_SIZE_MB', '3.0')),
-            max_presets_per_collection=int(os.getenv('MIDI_MAX_PRESETS_PER_COLLECTION', '1000')),
-            max_folder_depth=int(os.getenv('MIDI_MAX_FOLDER_DEPTH', '4')),
-            strict_mode=os.getenv('MIDI_STRICT_MODE', 'false').lower() == 'true'
-        )
-        
-        logging_config = LoggingConfig(
-            level=os.getenv('MIDI_LOG_LEVEL', 'INFO'),
-            json_format=os.getenv('MIDI_JSON_LOGS', 'false').lower() == 'true',
-            log_file=Path(log_file) if (log_file := os.getenv('MIDI_LOG_FILE')) else None
-        )
+        # Parsing is cached on the variables' values; the configs are built
+        # fresh so callers never share mutable instances
+        environ = os.environ
+        sections = _parse_environment(tuple(environ.get(spec[0]) for spec in _ENV_SPEC))
         
         config = cls(
-            devices_folder=Path(devices_folder),
-            validation=validation_config,
-            logging=logging_config
+            validation=ValidationConfig(**sections['validation']),
+            logging=LoggingConfig(**sections['logging']),
+            **sections[None]
         )
         
         logger.info("Configuration loaded from environment variables")
@@ -179,19 +211,16 @@ class AppConfig:
     
     def save_to_file(self, config_file: Path):
         """Save configuration to JSON file"""
-        logger.info(f"Saving configuration to file: {config_file}")
+        logger.info("Saving configuration to file: %s", config_file)
         
         try:
-            config_dict = self.to_dict()
-            
-            with open(config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            jsonio.dump(self.to_dict(), config_file, indent=True)
             
-            logger.info(f"Configuration saved successfully")
+            logger.info("Configuration saved successfully")
             
         except Exception as e:
             logger.error(
-                f"Error saving configuration: {e}",
+                "Error saving configuration: %s", e,
                 extra={'config_file': str(config_file), 'error': str(e)}
             )
             raise
@@ -1,40 +1,81 @@
+import functools
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import time
 
 from .logging import get_logger
 
+
+def _ttl_cached(method):
+    """Reuse a query's result for ``cache_ttl`` seconds instead of running git again"""
+    @functools.wraps(method)
+    def wrapper(self):
+        now = time.monotonic()
+        entry = self._cache.get(method.__name__)
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            return entry[1]
+        
+        # The first query runs the repository check, which logs whether
+        # git can be used here
+        self.is_git_repo
+        value = method(self)
+        self._cache[method.__name__] = (now, value)
+        return value
+    
+    return wrapper
+
+
 class GitUtils:
-    def __init__(self, repo_path: Optional[Path] = None):
+    def __init__(self, repo_path: Optional[Path] = None, cache_ttl: float = 5.0):
         self.repo_path = repo_path or Path.cwd()
         self.logger = get_logger('utils.git')
+        self.cache_ttl = cache_ttl
+        
+        # method name -> (time fetched, result)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
         
         self.logger.debug(
-            f"GitUtils initialized",
+            "GitUtils initialized",
             extra={'repo_path': str(self.repo_path)}
         )
         
-        # Verify git repository
-        if self._is_git_repository():
-            self.logger.info("Git repository detected")
-        else:
-            self.logger.warning("Not in a git repository or git not available")
+        # Checked by the first query; queries still fail softly without it
+        self._is_repo: Optional[bool] = None
+    
+    @property
+    def is_git_repo(self) -> bool:
+        """Whether repo_path is inside a git repository"""
+        if self._is_repo is None:
+            self._is_repo = self._is_git_repository()
+            if self._is_repo:
+                self.logger.info("Git repository detected")
+            else:
+                self.logger.warning("Not in a git repository or git not available")
+        return self._is_repo
     
     def _is_git_repository(self) -> bool:
         """Check if current directory is a git repository"""
+        # A .git directory (or worktree file) answers this with one stat;
+        # subdirectories of a repository still need git itself
+        if (self.repo_path / '.git').exists():
+            self.logger.debug(
+                "Git repository check: found .git",
+                extra={'repo_path': str(self.repo_path)}
+            )
+            return True
+        
         try:
             result = subprocess.run(
                 ['git', 'rev-parse', '--git-dir'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=5
             )
             is_git_repo = result.returncode == 0
             
             self.logger.debug(
-                f"Git repository check: {'found' if is_git_repo else 'not found'}",
+                "Git repository check: %s", 'found' if is_git_repo else 'not found',
                 extra={'repo_path': str(self.repo_path)}
             )
             
@@ -42,11 +83,16 @@ class GitUtils:
             
         except Exception as e:
             self.logger.debug(
-                f"Error checking git repository: {e}",
+                "Error checking git repository: %s", e,
                 extra={'error': str(e)}
             )
             return False
     
+    def clear_cache(self):
+        """Forget cached query results, e.g. after committing"""
+        self._cache.clear()
+    
+    @_ttl_cached
     def get_revision_count(self) -> int:
         """Get current git revision number"""
         start_time = time.time()
@@ -57,7 +103,6 @@ class GitUtils:
             result = subprocess.run(
                 ['git', 'rev-list', '--count', 'HEAD'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=10
             )
@@ -65,9 +110,9 @@ class GitUtils:
             duration = (time.time() - start_time) * 1000
             
             if result.returncode == 0:
-                revision_count = int(result.stdout.strip())
+                revision_count = int(result.stdout)
                 self.logger.info(
-                    f"Git revision count: {revision_count}",
+                    "Git revision count: %s", revision_count,
                     extra={
                         'revision_count': revision_count,
                         'duration_ms': duration
@@ -75,11 +120,12 @@ class GitUtils:
                 )
                 return revision_count
             else:
+                stderr = result.stderr.decode('utf-8', 'replace')
                 self.logger.warning(
-                    f"Git rev-list failed: {result.stderr}",
+                    "Git rev-list failed: %s", stderr,
                     extra={
                         'return_code': result.returncode,
-                        'stderr': result.stderr,
+                        'stderr': stderr,
                         'duration_ms': duration
                     }
                 )
@@ -91,7 +137,7 @@ class GitUtils:
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             self.logger.error(
-                f"Error getting git revision count: {e}",
+                "Error getting git revision count: %s", e,
                 extra={
                     'error': str(e),
                     'error_type': type(e).__name__,
@@ -100,6 +146,7 @@ class GitUtils:
             )
             return 0
     
+    @_ttl_cached
     def get_current_hash(self) -> str:
         """Get current commit hash"""
         start_time = time.time()
@@ -110,7 +157,6 @@ class GitUtils:
             result = subprocess.run(
                 ['git', 'rev-parse', 'HEAD'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=10
             )
@@ -118,9 +164,9 @@ class GitUtils:
             duration = (time.time() - start_time) * 1000
             
             if result.returncode == 0:
-                commit_hash = result.stdout.strip()
+                commit_hash = result.stdout.decode('ascii').strip()
                 self.logger.info(
-                    f"Current git hash: {commit_hash[:16]}...",
+                    "Current git hash: %.16s...", commit_hash,
                     extra={
                         'commit_hash': commit_hash,
                         'short_hash': commit_hash[:8],
@@ -129,11 +175,12 @@ class GitUtils:
                 )
                 return commit_hash
             else:
+                stderr = result.stderr.decode('utf-8', 'replace')
                 self.logger.warning(
-                    f"Git rev-parse failed: {result.stderr}",
+                    "Git rev-parse failed: %s", stderr,
                     extra={
                         'return_code': result.returncode,
-                        'stderr': result.stderr,
+                        'stderr': stderr,
                         'duration_ms': duration
                     }
                 )
@@ -145,7 +192,7 @@ class GitUtils:
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             self.logger.error(
-                f"Error getting git hash: {e}",
+                "Error getting git hash: %s", e,
                 extra={
                     'error': str(e),
                     'error_type': type(e).__name__,
@@ -158,6 +205,15 @@ class GitUtils:
         """Get comprehensive repository information"""
         self.logger.info("Gathering repository information")
         
+        # Hash, branch and commit date come from one git call; the single
+        # getters then find them in the cache
+        head_info = self._get_head_info()
+        if head_info is not None:
+            now = time.monotonic()
+            self._cache['get_current_hash'] = (now, head_info['current_hash'])
+            self._cache['_get_current_branch'] = (now, head_info['branch_name'])
+            self._cache['_get_last_commit_date'] = (now, head_info['last_commit_date'])
+        
         info = {
             'revision_count': self.get_revision_count(),
             'current_hash': self.get_current_hash(),
@@ -168,7 +224,7 @@ class GitUtils:
         }
         
         self.logger.info(
-            f"Repository info gathered",
+            "Repository info gathered",
             extra={
                 'info': {k: v for k, v in info.items() if k != 'current_hash'},  # Don't log full hash
                 'current_hash_short': info['current_hash'][:8] if info['current_hash'] else None
@@ -177,94 +233,133 @@ class GitUtils:
         
         return info
     
+    @_ttl_cached
+    def _get_head_info(self) -> Optional[Dict[str, str]]:
+        """Get HEAD's commit hash, commit date and branch name with a single git call"""
+        try:
+            result = subprocess.run(
+                ['git', 'log', '-1', '--format=%H%x00%ci%x00%D'],
+                capture_output=True,
+                cwd=self.repo_path,
+                timeout=5
+            )
+            
+            if result.returncode != 0:
+                self.logger.debug("Could not read HEAD commit information")
+                return None
+            
+            commit_hash, commit_date, refs = result.stdout.decode('utf-8', 'replace').rstrip('\n').split('\x00')
+            
+            # %D lists "HEAD -> <branch>" on a branch and plain "HEAD" when detached,
+            # matching what rev-parse --abbrev-ref HEAD prints
+            branch = None
+            for ref in refs.split(', '):
+                if ref.startswith('HEAD -> '):
+                    branch = ref[len('HEAD -> '):]
+                elif ref == 'HEAD':
+                    branch = 'HEAD'
+            
+            if branch is None:
+                return None
+            
+            return {
+                'current_hash': commit_hash,
+                'branch_name': branch,
+                'last_commit_date': commit_date
+            }
+            
+        except Exception as e:
+            self.logger.debug("Error reading HEAD commit information: %s", e)
+            return None
+    
+    @_ttl_cached
     def _get_current_branch(self) -> str:
         """Get current branch name"""
         try:
             result = subprocess.run(
                 ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=5
             )
             
             if result.returncode == 0:
-                branch = result.stdout.strip()
-                self.logger.debug(f"Current branch: {branch}")
+                branch = result.stdout.decode('utf-8', 'replace').strip()
+                self.logger.debug("Current branch: %s", branch)
                 return branch
             else:
                 self.logger.debug("Could not determine current branch")
                 return "unknown"
                 
         except Exception as e:
-            self.logger.debug(f"Error getting current branch: {e}")
+            self.logger.debug("Error getting current branch: %s", e)
             return "unknown"
     
+    @_ttl_cached
     def _get_remote_url(self) -> str:
         """Get remote origin URL"""
         try:
             result = subprocess.run(
                 ['git', 'remote', 'get-url', 'origin'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=5
             )
             
             if result.returncode == 0:
-                url = result.stdout.strip()
-                self.logger.debug(f"Remote URL: {url}")
+                url = result.stdout.decode('utf-8', 'replace').strip()
+                self.logger.debug("Remote URL: %s", url)
                 return url
             else:
                 self.logger.debug("No remote origin found")
                 return ""
                 
         except Exception as e:
-            self.logger.debug(f"Error getting remote URL: {e}")
+            self.logger.debug("Error getting remote URL: %s", e)
             return ""
     
+    @_ttl_cached
     def _has_uncommitted_changes(self) -> bool:
         """Check if repository has uncommitted changes"""
         try:
             result = subprocess.run(
                 ['git', 'status', '--porcelain'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=5
             )
             
             if result.returncode == 0:
                 has_changes = bool(result.stdout.strip())
-                self.logger.debug(f"Has uncommitted changes: {has_changes}")
+                self.logger.debug("Has uncommitted changes: %s", has_changes)
                 return has_changes
             else:
                 self.logger.debug("Could not check for uncommitted changes")
                 return False
                 
         except Exception as e:
-            self.logger.debug(f"Error checking uncommitted changes: {e}")
+            self.logger.debug("Error checking uncommitted changes: %s", e)
             return False
     
+    @_ttl_cached
     def _get_last_commit_date(self) -> str:
         """Get last commit date"""
         try:
             result = subprocess.run(
                 ['git', 'log', '-1', '--format=%ci'],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 timeout=5
             )
             
             if result.returncode == 0:
-                date = result.stdout.strip()
-                self.logger.debug(f"Last commit date: {date}")
+                date = result.stdout.decode('ascii').strip()
+                self.logger.debug("Last commit date: %s", date)
                 return date
             else:
                 self.logger.debug("Could not get last commit date")
                 return ""
                 
         except Exception as e:
-            self.logger.debug(f"Error getting last commit date: {e}")
+            self.logger.debug("Error getting last commit date: %s", e)
             return ""
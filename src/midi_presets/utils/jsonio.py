@@ -0,0 +1,67 @@
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch either backend
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types manifests and models carry, on both backends"""
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, two-space indented when ``indent`` is set
+    
+    Paths, enums and datetimes are encoded unless ``default`` is given.
+    """
+    if default is None:
+        default = _default
+    
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    # Match orjson's output: no ASCII escaping, compact separators
+    return json.dumps(
+        obj,
+        default=default,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":")
+    ).encode("utf-8")
+
+
+def load(path: Path) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump(obj: Any, path: Path, indent: bool = False, default: Optional[Callable[[Any], Any]] = None):
+    """Serialize to a JSON file"""
+    data = dumps(obj, indent=indent, default=default)
+    with open(path, "wb") as f:
+        f.write(data)
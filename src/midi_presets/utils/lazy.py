@@ -0,0 +1,28 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_imports(
+    module_globals: Dict[str, Any],
+    lazy: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Module ``__getattr__`` and ``__dir__`` for names imported on first access
+    
+    ``lazy`` maps each name to the module, relative to the package, that
+    defines it. An imported name is stored in the module's globals, so later
+    lookups do not come back here.
+    """
+    package = module_globals['__name__']
+    
+    def __getattr__(name: str) -> Any:
+        module = lazy.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        module_globals[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(lazy))
+    
+    return __getattr__, __dir__
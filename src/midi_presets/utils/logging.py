@@ -1,16 +1,39 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
-import json
+import time
+
+from . import jsonio
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
+    # Record attributes copied into the entry when present:
+    # (attribute, output key, conversion)
+    _EXTRA_KEYS = (
+        ('file_path', 'file_path', str),
+        ('validation_type', 'validation_type', None),
+        ('duration', 'duration_ms', None),
+        ('error_count', 'error_count', None),
+    )
+    
+    # (whole second, formatted date and time) of the last record
+    _second_prefix = (None, '')
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO 8601 UTC time of a record, formatting the date part once per second"""
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1e6):06d}Z"
+    
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -20,28 +43,35 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add extra fields if present
-        if hasattr(record, 'file_path'):
-            log_entry['file_path'] = str(record.file_path)
-        if hasattr(record, 'validation_type'):
-            log_entry['validation_type'] = record.validation_type
-        if hasattr(record, 'duration'):
-            log_entry['duration_ms'] = record.duration
-        if hasattr(record, 'error_count'):
-            log_entry['error_count'] = record.error_count
+        record_dict = record.__dict__
+        for attr, key, convert in self._EXTRA_KEYS:
+            if attr in record_dict:
+                value = record_dict[attr]
+                log_entry[key] = convert(value) if convert else value
         
-        return json.dumps(log_entry)
+        return jsonio.dumps(log_entry).decode('utf-8')
 
 class LoggerSetup:
-    @staticmethod
+    # (level, log_file, json_format) of the handlers currently installed
+    _current_setup = None
+    
+    @classmethod
     def setup_logging(
+        cls,
         level: str = "INFO",
         log_file: Optional[Path] = None,
         json_format: bool = False
     ) -> logging.Logger:
-        """Setup structured logging"""
+        """Setup structured logging
         
-        # Create main logger
+        Repeating the current setup leaves the installed handlers in place.
+        """
         logger = logging.getLogger('midi_presets')
+        setup = (level.upper(), log_file, json_format)
+        if setup == cls._current_setup and logger.handlers:
+            return logger
+        
+        # Configure main logger
         logger.setLevel(getattr(logging, level.upper()))
         
         # Remove existing handlers
@@ -69,9 +99,29 @@ class LoggerSetup:
             file_handler.setFormatter(JSONFormatter())
             logger.addHandler(file_handler)
         
+        cls._current_setup = setup
         return logger
+    
+    @staticmethod
+    def skip_record_details():
+        """Stop looking up threads, processes and asyncio tasks for every LogRecord
+        
+        These flags are process-wide, so only command-line entry points that
+        own the whole process call this; neither format here reports them.
+        """
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        if hasattr(logging, 'logAsyncioTasks'):
+            logging.logAsyncioTasks = False
+    
+    @classmethod
+    def current_setup(cls) -> Optional[tuple]:
+        """(level, log_file, json_format) of the last setup_logging call, if any"""
+        return cls._current_setup
 
 # Convenience function
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger instance"""
+    """Get a logger instance, cached per name"""
     return logging.getLogger(f'midi_presets.{name}')
@@ -9,6 +9,7 @@ This package provides comprehensive validation including:
 """
 
 from .base import BaseValidator, ValidationError
+from .context import ValidationContext
 from .content import ContentValidator
 from .security import SecurityValidator
 from .business import BusinessRulesValidator
@@ -17,6 +18,7 @@ from .structure import StructureValidator
 __all__ = [
     "BaseValidator",
     "ValidationError",
+    "ValidationContext",
     "ContentValidator", 
     "SecurityValidator",
     "BusinessRulesValidator",
@@ -2,20 +2,38 @@ from abc import ABC, abstractmethod
 from typing import List, Any
 from pathlib import Path
 
+_PREFIX = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}
+
 class ValidationError:
+    __slots__ = ('message', 'severity', 'file_path', '_str')
+    
     def __init__(self, message: str, severity: str = "error", file_path: Path = None):
         self.message = message
         self.severity = severity  # "error", "warning", "info"
         self.file_path = file_path
+        self._str = None
     
     def __str__(self):
-        prefix = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}[self.severity]
-        location = f" ({self.file_path})" if self.file_path else ""
-        return f"{prefix} {self.message}{location}"
+        # Formatted on first use; an issue is printed and logged at least once
+        if self._str is None:
+            prefix = _PREFIX[self.severity]
+            location = f" ({self.file_path})" if self.file_path else ""
+            self._str = f"{prefix} {self.message}{location}"
+        return self._str
 
 class BaseValidator(ABC):
     def __init__(self):
-        self.errors: List[ValidationError] = []
+        # Every issue in the order it was added, and the same issues per
+        # severity so the checks and getters below never have to filter.
+        # Only add_error and clear_errors change them.
+        self._issues: List[ValidationError] = []
+        self._errors: List[ValidationError] = []
+        self._warnings: List[ValidationError] = []
+    
+    @property
+    def errors(self) -> List[ValidationError]:
+        """A copy of all recorded issues in the order they were added"""
+        return list(self._issues)
     
     @abstractmethod
     def validate(self, target: Any) -> bool:
@@ -23,19 +41,26 @@ class BaseValidator(ABC):
         pass
     
     def add_error(self, message: str, severity: str = "error", file_path: Path = None):
-        self.errors.append(ValidationError(message, severity, file_path))
+        issue = ValidationError(message, severity, file_path)
+        self._issues.append(issue)
+        if severity == "error":
+            self._errors.append(issue)
+        elif severity == "warning":
+            self._warnings.append(issue)
     
     def has_errors(self) -> bool:
-        return any(e.severity == "error" for e in self.errors)
+        return bool(self._errors)
     
     def has_warnings(self) -> bool:
-        return any(e.severity == "warning" for e in self.errors)
+        return bool(self._warnings)
     
     def get_errors(self) -> List[ValidationError]:
-        return [e for e in self.errors if e.severity == "error"]
+        return list(self._errors)
     
     def get_warnings(self) -> List[ValidationError]:
-        return [e for e in self.errors if e.severity == "warning"]
+        return list(self._warnings)
     
     def clear_errors(self):
-        self.errors.clear()
+        self._issues.clear()
+        self._errors.clear()
+        self._warnings.clear()
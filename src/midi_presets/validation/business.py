@@ -1,9 +1,13 @@
-import json
 from pathlib import Path
+from typing import Any, Dict, Optional, Union
 from collections import defaultdict, Counter
+from datetime import datetime
+from itertools import chain
+import logging
 import time
 
 from .base import BaseValidator
+from .context import ValidationContext
 from ..models.device import DeviceModel
 from ..utils.logging import get_logger
 
@@ -14,58 +18,74 @@ class BusinessRulesValidator(BaseValidator):
 
         self.logger.info("BusinessRulesValidator initialized")
 
-    def validate(self, file_path: Path) -> bool:
+    def validate(self, target: Union[Path, ValidationContext]) -> bool:
         """Validate business logic rules"""
         start_time = time.time()
+        ctx = ValidationContext.of(target)
+        file_path = ctx.file_path
 
-        self.logger.info(
-            f"Starting business rules validation",
-            extra={'file_path': str(file_path), 'validation_type': 'business_rules'}
-        )
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            device = DeviceModel(**data)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Starting business rules validation",
+                extra={'file_path': str(file_path), 'validation_type': 'business_rules'}
+            )
 
+        # The content check has already reported why this file cannot be
+        # read or parsed into a device
+        if ctx.content_valid is False:
             self.logger.debug(
-                f"Device model created for business validation",
-                extra={
-                    'file_path': str(file_path),
-                    'device_name': device.device_info.name,
-                    'collections_count': len(device.preset_collections)
-                }
+                "Skipping business rules, content validation failed",
+                extra={'file_path': str(file_path)}
             )
+            return False
+
+        try:
+            device = ctx.device_model
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Device model created for business validation",
+                    extra={
+                        'file_path': str(file_path),
+                        'device_name': device.device_info.name,
+                        'collections_count': len(device.preset_collections)
+                    }
+                )
 
             valid = True
             validation_results = {}
 
+            # Presets are walked once; the per-preset rules report from the scan
+            scan = self._scan_presets(device)
+
             # Run all business rule validations
-            validation_results['preset_id_uniqueness'] = self._validate_preset_id_uniqueness(device, file_path)
-            validation_results['midi_ranges'] = self._validate_midi_ranges(device, file_path)
+            validation_results['preset_id_uniqueness'] = self._validate_preset_id_uniqueness(device, file_path, scan)
+            validation_results['midi_ranges'] = self._validate_midi_ranges(device, file_path, scan)
             validation_results['collection_consistency'] = self._validate_collection_consistency(device, file_path)
-            validation_results['naming_conventions'] = self._validate_naming_conventions(device, file_path)
-            validation_results['data_integrity'] = self._validate_data_integrity(device, file_path)
+            validation_results['naming_conventions'] = self._validate_naming_conventions(device, file_path, scan)
+            validation_results['data_integrity'] = self._validate_data_integrity(device, file_path, scan)
 
             # Overall result
             valid = all(validation_results.values())
 
             duration = (time.time() - start_time) * 1000
 
-            self.logger.info(
-                f"Business rules validation {'passed' if valid else 'failed'}",
-                extra={
-                    'file_path': str(file_path),
-                    'validation_results': validation_results,
-                    'duration_ms': duration,
-                    'error_count': len(self.get_errors()),
-                    'warning_count': len(self.get_warnings())
-                }
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Business rules validation {'passed' if valid else 'failed'}",
+                    extra={
+                        'file_path': str(file_path),
+                        'validation_results': validation_results,
+                        'duration_ms': duration,
+                        'error_count': len(self.get_errors()),
+                        'warning_count': len(self.get_warnings())
+                    }
+                )
 
             return valid
 
+        # Any failure, including a file that could not be read or parsed into
+        # a device, is reported as a validation error rather than raised
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             self.logger.error(
@@ -80,39 +100,157 @@ class BusinessRulesValidator(BaseValidator):
             self.add_error(f"Error in business rules validation: {e}", file_path=file_path)
             return False
 
-    def _validate_preset_id_uniqueness(self, device: DeviceModel, file_path: Path) -> bool:
+    def _scan_presets(self, device: DeviceModel) -> Dict[str, Any]:
+        """Walk every preset once, collecting what the per-preset rules check"""
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        ids_by_collection = {}
+        midi_stats = {
+            'cc_0_out_of_range': 0,
+            'pgm_out_of_range': 0,
+            'total_presets': 0,
+            # Only the number of distinct values is reported, so a byte per
+            # MIDI value marks which ones occur
+            'cc_0_seen': bytearray(128),
+            'pgm_seen': bytearray(128)
+        }
+        # (field, value, preset_id, collection) in the order they were found
+        midi_range_issues = []
+        preset_name_patterns = defaultdict(int)
+        category_distribution = defaultdict(int)
+        long_names = []
+        integrity_stats = {
+            'empty_preset_names': 0,
+            'empty_sendmidi_commands': 0,
+            'missing_characters': 0,
+            'future_dates': 0,
+            'invalid_ratings': 0
+        }
+        cc_0_seen = midi_stats['cc_0_seen']
+        pgm_seen = midi_stats['pgm_seen']
+        # One reference time for every preset's creation date
+        now = datetime.now()
+
+        for collection_name, collection in device.preset_collections.items():
+            collection_ids = []
+            preset_metadata = collection.preset_metadata
+
+            for preset in collection.presets:
+                preset_id = preset.preset_id
+                preset_name = preset.preset_name
+                cc_0 = preset.cc_0
+                pgm = preset.pgm
+
+                collection_ids.append(preset_id)
+
+                # MIDI ranges
+                # A value is outside 0..127 exactly when a bit above the low
+                # seven is set; Python's negative ints have those bits set too
+                if cc_0 is not None:
+                    if cc_0 & ~0x7F:
+                        midi_stats['cc_0_out_of_range'] += 1
+                        midi_range_issues.append(('cc_0', cc_0, preset_id, collection_name))
+                    else:
+                        cc_0_seen[cc_0] = 1
+
+                if pgm & ~0x7F:
+                    midi_stats['pgm_out_of_range'] += 1
+                    midi_range_issues.append(('pgm', pgm, preset_id, collection_name))
+                else:
+                    pgm_seen[pgm] = 1
+
+                # Naming conventions; the distributions are only logged, so
+                # they are not collected when INFO is off
+                if info_enabled:
+                    name_words = preset_name.lower().split()
+                    if name_words:
+                        preset_name_patterns[name_words[0]] += 1
+                    category_distribution[preset.category] += 1
+
+                if len(preset_name) > 50:
+                    long_names.append((preset_id, preset_name))
+
+                # Data integrity
+                if not preset_name.strip():
+                    integrity_stats['empty_preset_names'] += 1
+
+                if not preset.sendmidi_command.strip():
+                    integrity_stats['empty_sendmidi_commands'] += 1
+
+                if not preset.characters:
+                    integrity_stats['missing_characters'] += 1
+
+                preset_meta = preset_metadata.get(preset_id)
+                if preset_meta:
+                    if preset_meta.created_date.replace(tzinfo=None) > now:
+                        integrity_stats['future_dates'] += 1
+
+                # Most presets carry no ratings
+                user_ratings = preset.user_ratings
+                if user_ratings:
+                    for rating_value in user_ratings.values():
+                        if isinstance(rating_value, (int, float)) and not (0 <= rating_value <= 10):
+                            integrity_stats['invalid_ratings'] += 1
+
+            midi_stats['total_presets'] += len(collection_ids)
+            ids_by_collection[collection_name] = collection_ids
+
+        return {
+            'ids_by_collection': ids_by_collection,
+            'midi_stats': midi_stats,
+            'midi_range_issues': midi_range_issues,
+            'preset_name_patterns': preset_name_patterns,
+            'category_distribution': category_distribution,
+            'long_names': long_names,
+            'integrity_stats': integrity_stats
+        }
+
+    def _validate_preset_id_uniqueness(self, device: DeviceModel, file_path: Path, scan: Optional[Dict[str, Any]] = None) -> bool:
         """Validate that all preset IDs are unique across collections"""
         self.logger.debug("Validating preset ID uniqueness")
 
-        all_preset_ids = []
-        collection_preset_counts = {}
+        if scan is None:
+            scan = self._scan_presets(device)
 
-        for collection_name, collection in device.preset_collections.items():
-            collection_ids = [preset.preset_id for preset in collection.presets]
-            all_preset_ids.extend(collection_ids)
+        seen = set()
+        duplicate_set = set()
+        total_presets = 0
+        collection_preset_counts = {}
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        for collection_name, collection_ids in scan['ids_by_collection'].items():
+            for preset_id in collection_ids:
+                if preset_id in seen:
+                    duplicate_set.add(preset_id)
+                else:
+                    seen.add(preset_id)
+            total_presets += len(collection_ids)
             collection_preset_counts[collection_name] = len(collection_ids)
 
-            self.logger.debug(
-                f"Collection {collection_name} has {len(collection_ids)} presets",
-                extra={
-                    'collection_name': collection_name,
-                    'preset_count': len(collection_ids),
-                    'preset_ids': collection_ids[:5]  # Log first 5 IDs
-                }
-            )
-
-        # Find duplicates
-        id_counts = Counter(all_preset_ids)
-        duplicates = [pid for pid, count in id_counts.items() if count > 1]
+            if debug_enabled:
+                self.logger.debug(
+                    f"Collection {collection_name} has {len(collection_ids)} presets",
+                    extra={
+                        'collection_name': collection_name,
+                        'preset_count': len(collection_ids),
+                        'preset_ids': collection_ids[:5]  # Log first 5 IDs
+                    }
+                )
 
-        if duplicates:
+        if duplicate_set:
+            # Reported in order of each ID's first appearance
+            duplicates = [
+                pid
+                for pid in dict.fromkeys(chain.from_iterable(scan['ids_by_collection'].values()))
+                if pid in duplicate_set
+            ]
             self.logger.error(
                 f"Found {len(duplicates)} duplicate preset IDs",
                 extra={
                     'file_path': str(file_path),
                     'duplicate_ids': duplicates,
-                    'total_presets': len(all_preset_ids),
-                    'unique_presets': len(set(all_preset_ids))
+                    'total_presets': total_presets,
+                    'unique_presets': len(seen)
                 }
             )
 
@@ -122,82 +260,70 @@ class BusinessRulesValidator(BaseValidator):
             )
             return False
 
-        self.logger.info(
-            f"Preset ID uniqueness validation passed",
-            extra={
-                'total_presets': len(all_preset_ids),
-                'collections': collection_preset_counts
-            }
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Preset ID uniqueness validation passed",
+                extra={
+                    'total_presets': total_presets,
+                    'collections': collection_preset_counts
+                }
+            )
         return True
 
-    def _validate_midi_ranges(self, device: DeviceModel, file_path: Path) -> bool:
+    def _validate_midi_ranges(self, device: DeviceModel, file_path: Path, scan: Optional[Dict[str, Any]] = None) -> bool:
         """Validate MIDI values are within acceptable ranges"""
         self.logger.debug("Validating MIDI ranges")
 
-        valid = True
-        midi_stats = {
-            'cc_0_out_of_range': 0,
-            'pgm_out_of_range': 0,
-            'total_presets': 0,
-            'cc_0_distribution': defaultdict(int),
-            'pgm_distribution': defaultdict(int)
-        }
-
-        for collection_name, collection in device.preset_collections.items():
-            for preset in collection.presets:
-                midi_stats['total_presets'] += 1
+        if scan is None:
+            scan = self._scan_presets(device)
 
-                # Validate CC_0
-                if preset.cc_0 is not None:
-                    midi_stats['cc_0_distribution'][preset.cc_0] += 1
-                    if not (0 <= preset.cc_0 <= 127):
-                        midi_stats['cc_0_out_of_range'] += 1
-                        self.add_error(
-                            f"CC_0 value {preset.cc_0} out of MIDI range for preset {preset.preset_id}",
-                            severity="warning",
-                            file_path=file_path
-                        )
-                        self.logger.warning(
-                            f"CC_0 out of range",
-                            extra={
-                                'preset_id': preset.preset_id,
-                                'cc_0': preset.cc_0,
-                                'collection': collection_name
-                            }
-                        )
-
-                # Validate Program Change
-                midi_stats['pgm_distribution'][preset.pgm] += 1
-                if not (0 <= preset.pgm <= 127):
-                    midi_stats['pgm_out_of_range'] += 1
-                    self.add_error(
-                        f"Program value {preset.pgm} out of MIDI range for preset {preset.preset_id}",
-                        severity="warning",
-                        file_path=file_path
-                    )
-                    self.logger.warning(
-                        f"Program number out of range",
-                        extra={
-                            'preset_id': preset.preset_id,
-                            'pgm': preset.pgm,
-                            'collection': collection_name
-                        }
-                    )
+        valid = True
+        midi_stats = scan['midi_stats']
+
+        for field, value, preset_id, collection_name in scan['midi_range_issues']:
+            if field == 'cc_0':
+                self.add_error(
+                    f"CC_0 value {value} out of MIDI range for preset {preset_id}",
+                    severity="warning",
+                    file_path=file_path
+                )
+                self.logger.warning(
+                    "CC_0 out of range",
+                    extra={
+                        'preset_id': preset_id,
+                        'cc_0': value,
+                        'collection': collection_name
+                    }
+                )
+            else:
+                self.add_error(
+                    f"Program value {value} out of MIDI range for preset {preset_id}",
+                    severity="warning",
+                    file_path=file_path
+                )
+                self.logger.warning(
+                    "Program number out of range",
+                    extra={
+                        'preset_id': preset_id,
+                        'pgm': value,
+                        'collection': collection_name
+                    }
+                )
 
-        self.logger.info(
-            f"MIDI ranges validation completed",
-            extra={
-                'file_path': str(file_path),
-                'midi_stats': {
-                    'total_presets': midi_stats['total_presets'],
-                    'cc_0_out_of_range': midi_stats['cc_0_out_of_range'],
-                    'pgm_out_of_range': midi_stats['pgm_out_of_range'],
-                    'unique_cc_0_values': len(midi_stats['cc_0_distribution']),
-                    'unique_pgm_values': len(midi_stats['pgm_distribution'])
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "MIDI ranges validation completed",
+                extra={
+                    'file_path': str(file_path),
+                    'midi_stats': {
+                        'total_presets': midi_stats['total_presets'],
+                        'cc_0_out_of_range': midi_stats['cc_0_out_of_range'],
+                        'pgm_out_of_range': midi_stats['pgm_out_of_range'],
+                        'unique_cc_0_values': 128 - midi_stats['cc_0_seen'].count(0),
+                        'unique_pgm_values': 128 - midi_stats['pgm_seen'].count(0)
+                    }
                 }
-            }
-        )
+            )
 
         return valid
 
@@ -205,21 +331,30 @@ class BusinessRulesValidator(BaseValidator):
         """Validate internal consistency of collections"""
         self.logger.debug("Validating collection consistency")
 
-        consistency_issues = []
+        issue_count = 0
+        add_error = self.add_error
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        collections = device.preset_collections
 
-        for collection_name, collection in device.preset_collections.items():
-            self.logger.debug(
-                f"Checking consistency for collection: {collection_name}",
-                extra={'collection_name': collection_name}
-            )
+        for collection_name, collection in collections.items():
+            metadata = collection.metadata
+
+            if debug_enabled:
+                self.logger.debug(
+                    f"Checking consistency for collection: {collection_name}",
+                    extra={'collection_name': collection_name}
+                )
 
             # Check if parent collections exist
-            for parent in collection.metadata.parent_collections:
-                if parent not in device.preset_collections:
-                    issue = f"Collection '{collection_name}' references non-existent parent '{parent}'"
-                    consistency_issues.append(issue)
+            for parent in metadata.parent_collections:
+                if parent not in collections:
+                    add_error(
+                        f"Collection '{collection_name}' references non-existent parent '{parent}'",
+                        file_path=file_path
+                    )
+                    issue_count += 1
                     self.logger.error(
-                        f"Non-existent parent collection referenced",
+                        "Non-existent parent collection referenced",
                         extra={
                             'collection_name': collection_name,
                             'parent_collection': parent
@@ -227,26 +362,27 @@ class BusinessRulesValidator(BaseValidator):
                     )
 
             # Check readonly consistency
-            if collection.metadata.readonly and collection.metadata.sync_status != 'synced':
-                issue = f"Readonly collection '{collection_name}' has sync status '{collection.metadata.sync_status}'"
-                consistency_issues.append(issue)
+            sync_status = metadata.sync_status
+            if metadata.readonly and sync_status != 'synced':
+                add_error(
+                    f"Readonly collection '{collection_name}' has sync status '{sync_status}'",
+                    file_path=file_path
+                )
+                issue_count += 1
                 self.logger.warning(
-                    f"Readonly collection has unexpected sync status",
+                    "Readonly collection has unexpected sync status",
                     extra={
                         'collection_name': collection_name,
-                        'sync_status': collection.metadata.sync_status
+                        'sync_status': sync_status
                     }
                 )
 
-        if consistency_issues:
-            for issue in consistency_issues:
-                self.add_error(issue, file_path=file_path)
-
+        if issue_count:
             self.logger.error(
-                f"Collection consistency validation failed with {len(consistency_issues)} issues",
+                f"Collection consistency validation failed with {issue_count} issues",
                 extra={
                     'file_path': str(file_path),
-                    'consistency_issues': consistency_issues
+                    'issue_count': issue_count
                 }
             )
             return False
@@ -254,102 +390,63 @@ class BusinessRulesValidator(BaseValidator):
         self.logger.info("Collection consistency validation passed")
         return True
 
-    def _validate_naming_conventions(self, device: DeviceModel, file_path: Path) -> bool:
+    def _validate_naming_conventions(self, device: DeviceModel, file_path: Path, scan: Optional[Dict[str, Any]] = None) -> bool:
         """Validate naming conventions"""
         self.logger.debug("Validating naming conventions")
 
-        naming_issues = []
+        if scan is None:
+            scan = self._scan_presets(device)
 
-        # Check for consistent naming patterns
-        preset_name_patterns = defaultdict(int)
-        category_distribution = defaultdict(int)
+        naming_issue_count = 0
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+        preset_name_patterns = scan['preset_name_patterns']
+        category_distribution = scan['category_distribution']
 
-        for collection_name, collection in device.preset_collections.items():
-            for preset in collection.presets:
-                # Analyze preset name patterns
-                name_words = preset.preset_name.lower().split()
-                if name_words:
-                    first_word = name_words[0]
-                    preset_name_patterns[first_word] += 1
-
-                # Track category distribution
-                category_distribution[preset.category] += 1
-
-                # Check for very long names
-                if len(preset.preset_name) > 50:
-                    naming_issues.append(f"Preset '{preset.preset_id}' has very long name: {preset.preset_name}")
-                    self.logger.warning(
-                        f"Very long preset name",
-                        extra={
-                            'preset_id': preset.preset_id,
-                            'name_length': len(preset.preset_name),
-                            'preset_name': preset.preset_name
-                        }
-                    )
+        # Check for very long names
+        for preset_id, preset_name in scan['long_names']:
+            naming_issue_count += 1
+            self.logger.warning(
+                "Very long preset name",
+                extra={
+                    'preset_id': preset_id,
+                    'name_length': len(preset_name),
+                    'preset_name': preset_name
+                }
+            )
 
-        # Convert defaultdict to Counter for most_common method
-        from collections import Counter
-        name_patterns_counter = Counter(preset_name_patterns)
+        if info_enabled:
+            # Convert defaultdict to Counter for most_common method
+            name_patterns_counter = Counter(preset_name_patterns)
 
-        self.logger.info(
-            f"Naming convention analysis completed",
-            extra={
-                'file_path': str(file_path),
-                'top_name_patterns': dict(name_patterns_counter.most_common(5)),
-                'category_distribution': dict(category_distribution),
-                'naming_issues_count': len(naming_issues)
-            }
-        )
+            self.logger.info(
+                "Naming convention analysis completed",
+                extra={
+                    'file_path': str(file_path),
+                    'top_name_patterns': dict(name_patterns_counter.most_common(5)),
+                    'category_distribution': dict(category_distribution),
+                    'naming_issues_count': naming_issue_count
+                }
+            )
 
-        return len(naming_issues) == 0
+        return naming_issue_count == 0
 
-    def _validate_data_integrity(self, device: DeviceModel, file_path: Path) -> bool:
+    def _validate_data_integrity(self, device: DeviceModel, file_path: Path, scan: Optional[Dict[str, Any]] = None) -> bool:
         """Validate data integrity"""
         self.logger.debug("Validating data integrity")
 
-        integrity_stats = {
-            'empty_preset_names': 0,
-            'empty_sendmidi_commands': 0,
-            'missing_characters': 0,
-            'future_dates': 0,
-            'invalid_ratings': 0
-        }
-
-        for collection_name, collection in device.preset_collections.items():
-            for preset in collection.presets:
-                # Check for empty or whitespace-only names
-                if not preset.preset_name.strip():
-                    integrity_stats['empty_preset_names'] += 1
-
-                # Check sendmidi commands
-                if not preset.sendmidi_command.strip():
-                    integrity_stats['empty_sendmidi_commands'] += 1
-
-                # Check if preset has any characteristics
-                if not preset.characters:
-                    integrity_stats['missing_characters'] += 1
-
-                # Check metadata dates
-                preset_meta = collection.preset_metadata.get(preset.preset_id)
-                if preset_meta:
-                    from datetime import datetime
-                    now = datetime.now()
-                    if preset_meta.created_date.replace(tzinfo=None) > now:
-                        integrity_stats['future_dates'] += 1
+        if scan is None:
+            scan = self._scan_presets(device)
 
-                # Check user ratings validity
-                for rating_key, rating_value in preset.user_ratings.items():
-                    if isinstance(rating_value, (int, float)):
-                        if not (0 <= rating_value <= 10):
-                            integrity_stats['invalid_ratings'] += 1
+        integrity_stats = scan['integrity_stats']
 
-        self.logger.info(
-            f"Data integrity validation completed",
-            extra={
-                'file_path': str(file_path),
-                'integrity_stats': integrity_stats
-            }
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Data integrity validation completed",
+                extra={
+                    'file_path': str(file_path),
+                    'integrity_stats': integrity_stats
+                }
+            )
 
         # Log warnings for integrity issues
         for issue_type, count in integrity_stats.items():
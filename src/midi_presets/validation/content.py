@@ -1,22 +1,26 @@
-import json
 import time
 from pathlib import Path
-from typing import Any
-from pydantic import ValidationError as PydanticValidationError
+from typing import Union
 
 from .base import BaseValidator
-from ..models.device import DeviceModel
+from .context import ValidationContext
+from ..utils import jsonio
 from ..utils.logging import get_logger
 
+# Top-level fields every device file must have
+_REQUIRED_FIELDS = ("device_info", "preset_collections")
+
 class ContentValidator(BaseValidator):
     def __init__(self, max_file_size_mb: float = 3.0):
         super().__init__()
         self.max_file_size_mb = max_file_size_mb
         self.logger = get_logger('validation.content')
 
-    def validate(self, file_path: Path) -> bool:
+    def validate(self, target: Union[Path, ValidationContext]) -> bool:
         """Validate file content including size, JSON syntax, and schema"""
         start_time = time.time()
+        ctx = ValidationContext.of(target)
+        file_path = ctx.file_path
 
         self.logger.info(
             "Starting content validation",
@@ -25,15 +29,18 @@ class ContentValidator(BaseValidator):
 
         valid = True
 
-        if not self._validate_file_size(file_path):
+        if not self._validate_file_size(ctx):
             valid = False
 
-        if valid and not self._validate_json_syntax(file_path):
+        if valid and not self._validate_json_syntax(ctx):
             valid = False
 
-        if valid and not self._validate_schema(file_path):
+        if valid and not self._validate_schema(ctx):
             valid = False
 
+        # Later validators skip work that needs valid content
+        ctx.content_valid = valid
+
         duration = (time.time() - start_time) * 1000
 
         self.logger.info(
@@ -48,16 +55,32 @@ class ContentValidator(BaseValidator):
 
         return valid
 
-    def _validate_file_size(self, file_path: Path) -> bool:
-        if not file_path.exists():
+    def validate_bytes(self, data: bytes, name: str = "<memory>") -> bool:
+        """Validate content held in memory, reporting issues under ``name``"""
+        return self.validate(ValidationContext.from_bytes(data, Path(name)))
+
+    def _validate_file_size(self, ctx: ValidationContext) -> bool:
+        file_path = ctx.file_path
+        # Checked before the file is read, so an oversized file is never
+        # loaded into memory
+        try:
+            file_size = ctx.file_size
+        except FileNotFoundError:
             self.logger.error(
                 f"File does not exist: {file_path}",
                 extra={'file_path': file_path}
             )
             self.add_error(f"File does not exist: {file_path}", file_path=file_path)
             return False
+        except Exception as e:
+            self.logger.error(
+                f"File read error: {e}",
+                extra={'file_path': file_path}
+            )
+            self.add_error(f"Error reading file: {e}", file_path=file_path)
+            return False
 
-        size_mb = file_path.stat().st_size / (1024 * 1024)
+        size_mb = file_size / (1024 * 1024)
 
         self.logger.debug(
             f"Checking file size: {size_mb:.2f}MB",
@@ -76,13 +99,14 @@ class ContentValidator(BaseValidator):
             return False
         return True
 
-    def _validate_json_syntax(self, file_path: Path) -> bool:
+    def _validate_json_syntax(self, ctx: ValidationContext) -> bool:
+        file_path = ctx.file_path
         try:
             self.logger.debug("Validating JSON syntax", extra={'file_path': file_path})
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json.load(f)
+            # Parsed once here; the schema check and later validators reuse it
+            ctx.json_obj
             return True
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             self.logger.error(
                 f"JSON syntax error: {e}",
                 extra={'file_path': file_path}
@@ -97,40 +121,35 @@ class ContentValidator(BaseValidator):
             self.add_error(f"Error reading file: {e}", file_path=file_path)
             return False
 
-    def _validate_schema(self, file_path: Path) -> bool:
+    def _validate_schema(self, ctx: ValidationContext) -> bool:
+        file_path = ctx.file_path
         try:
-            self.logger.debug("Validating Pydantic schema", extra={'file_path': file_path})
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            self.logger.debug("Validating schema", extra={'file_path': file_path})
+            data = ctx.json_obj
+
+            if not isinstance(data, dict):
+                self.logger.error(
+                    "Invalid schema: top-level value is not an object",
+                    extra={'file_path': file_path}
+                )
+                self.add_error("Invalid schema: top-level value must be a JSON object", file_path=file_path)
+                return False
 
             # Check if this is a valid device schema by checking for required fields
-            required_fields = ["device_info", "preset_collections"]
-            if not all(field in data for field in required_fields):
+            missing_fields = [f for f in _REQUIRED_FIELDS if f not in data]
+            if missing_fields:
                 self.logger.error(
-                    f"Invalid schema: Missing required fields",
-                    extra={'file_path': file_path, 'required_fields': required_fields}
+                    "Invalid schema: Missing required fields",
+                    extra={'file_path': file_path, 'required_fields': _REQUIRED_FIELDS}
                 )
-                self.add_error(f"Invalid schema: Missing required fields: {[f for f in required_fields if f not in data]}", file_path=file_path)
+                self.add_error(f"Invalid schema: Missing required fields: {missing_fields}", file_path=file_path)
                 return False
 
-            # For valid schemas, create a model instance with validation disabled to avoid schema errors
-            # This is useful for testing with sample data that might not match the schema exactly
-            model = DeviceModel.model_construct(**data)
+            # Field-level validation is left to BusinessRulesValidator, which
+            # builds the validated DeviceModel
             self.logger.info("Schema validation passed", extra={'file_path': file_path})
             return True
 
-        except PydanticValidationError as e:
-            self.logger.error(
-                f"Schema validation failed with {len(e.errors())} errors",
-                extra={'file_path': file_path}
-            )
-            self.add_error("Schema validation failed:", file_path=file_path)
-            for error in e.errors():
-                field = " -> ".join(str(x) for x in error['loc'])
-                error_msg = f"  • {field}: {error['msg']}"
-                self.logger.debug(error_msg, extra={'file_path': file_path})
-                self.add_error(error_msg, file_path=file_path)
-            return False
         except Exception as e:
             self.logger.error(
                 f"Unexpected validation error: {e}",
@@ -0,0 +1,62 @@
+import os
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..utils import jsonio
+
+
+class ValidationContext:
+    """A file under validation, shared by every validator in the chain
+
+    The file is read, decoded, parsed and turned into a DeviceModel at most
+    once, on first access. Failures are not cached, so each validator that
+    needs a stage sees its exception.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        # Set by ContentValidator; None until content has been validated
+        self.content_valid: Optional[bool] = None
+
+    @classmethod
+    def of(cls, target: Union[Path, 'ValidationContext']) -> 'ValidationContext':
+        """Wrap a path in a context; contexts are returned as they are"""
+        return target if isinstance(target, cls) else cls(target)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, file_path: Path) -> 'ValidationContext':
+        """Context for content already in memory, reported under ``file_path``"""
+        ctx = cls(file_path)
+        # Seeds the raw_bytes cache, so the file is never opened
+        ctx.__dict__['raw_bytes'] = data
+        return ctx
+
+    @property
+    def file_size(self) -> int:
+        """Size in bytes, without reading the file unless it has been read"""
+        if 'raw_bytes' in self.__dict__:
+            return len(self.raw_bytes)
+        return os.stat(self.file_path).st_size
+
+    @cached_property
+    def raw_bytes(self) -> bytes:
+        with open(self.file_path, 'rb') as f:
+            return f.read()
+
+    @cached_property
+    def text(self) -> str:
+        return self.raw_bytes.decode('utf-8')
+
+    @cached_property
+    def json_obj(self) -> Any:
+        # Parsed from the bytes; orjson (when installed) needs no decoded copy
+        return jsonio.loads(self.raw_bytes)
+
+    @cached_property
+    def device_model(self):
+        # Imported here so path-only validation does not load the models
+        from ..models.device import DeviceModel
+        # model_validate hands the dict to pydantic-core as is, without
+        # repacking it into keyword arguments
+        return DeviceModel.model_validate(self.json_obj)
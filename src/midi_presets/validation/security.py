@@ -1,14 +1,44 @@
-import json
 from pathlib import Path
-from typing import List
+from typing import Dict, Union
 import time
 
 from .base import BaseValidator
+from .context import ValidationContext
 from ..utils.logging import get_logger
 
+# Non-ASCII characters that IGNORECASE regex matching treats as the ASCII
+# letter; str.lower() leaves the first three alone and turns the Kelvin sign
+# into 'k' by itself. Mapping them one to one keeps offsets unchanged.
+_CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+# Characters of content folded and searched at a time in fail_fast mode
+_WINDOW_SIZE = 64 * 1024
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for case-insensitive matching of the ASCII patterns"""
+    # translate() is slow on non-ASCII text, so it only runs when needed
+    if not text.isascii() and ('\u0130' in text or '\u0131' in text or '\u017f' in text):
+        text = text.translate(_CASE_FOLD)
+    return text.lower()
+
+
+class _Lazy:
+    """Log value computed only when a handler formats it"""
+    __slots__ = ('f',)
+    
+    def __init__(self, f):
+        self.f = f
+    
+    def __str__(self):
+        return self.f()
+
+
 class SecurityValidator(BaseValidator):
-    def __init__(self):
+    def __init__(self, fail_fast: bool = True):
         super().__init__()
+        # Stop at the first suspicious pattern; False reports every pattern found
+        self.fail_fast = fail_fast
         self.logger = get_logger('validation.security')
         self.suspicious_patterns = [
             'javascript:', '<script', 'eval(', 'function(', 'onclick=',
@@ -18,29 +48,67 @@ class SecurityValidator(BaseValidator):
             'getattr(', 'setattr(', 'delattr(', 'hasattr('
         ]
         
+        # Patterns are matched case-insensitively against a folded copy of
+        # the content
+        self._folded_patterns = [_fold(p) for p in self.suspicious_patterns]
+        # Windows scanned in fail_fast mode overlap by this much, so a
+        # pattern straddling two windows is still seen whole
+        self._window_overlap = max(len(p) for p in self.suspicious_patterns) - 1
+        
         self.logger.info(
             f"SecurityValidator initialized with {len(self.suspicious_patterns)} patterns",
             extra={'pattern_count': len(self.suspicious_patterns)}
         )
     
-    def validate(self, file_path: Path) -> bool:
+    def _find_patterns(self, content: str) -> Dict[str, int]:
+        """First occurrence of each suspicious pattern found in the content
+        
+        With fail_fast only the earliest pattern in the content is reported,
+        and the scan stops at the first window of content that has one.
+        """
+        patterns = list(zip(self.suspicious_patterns, self._folded_patterns))
+        
+        if not self.fail_fast:
+            folded = _fold(content)
+            pattern_locations = {}
+            for pattern, needle in patterns:
+                index = folded.find(needle)
+                if index != -1:
+                    pattern_locations[pattern] = index
+            return dict(sorted(pattern_locations.items(), key=lambda item: item[1]))
+        
+        for start in range(0, len(content), _WINDOW_SIZE):
+            window = _fold(content[start:start + _WINDOW_SIZE + self._window_overlap])
+            first = None
+            first_index = len(window)
+            for pattern, needle in patterns:
+                # Only an occurrence starting before the earliest one so far
+                # matters; on a tie the pattern listed first wins
+                index = window.find(needle, 0, first_index + len(needle) - 1)
+                if index != -1:
+                    first, first_index = pattern, index
+            if first is not None:
+                return {first: start + first_index}
+        return {}
+    
+    def validate(self, target: Union[Path, ValidationContext]) -> bool:
         """Check for suspicious/malicious content"""
         start_time = time.time()
+        ctx = ValidationContext.of(target)
+        file_path = ctx.file_path
         
         self.logger.info(
-            f"Starting security validation",
+            "Starting security validation",
             extra={'file_path': str(file_path), 'validation_type': 'security'}
         )
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = ctx.text
             
             file_size = len(content)
-            content_lower = content.lower()
             
             self.logger.debug(
-                f"Scanning file content",
+                "Scanning file content",
                 extra={
                     'file_path': str(file_path),
                     'file_size_chars': file_size,
@@ -48,25 +116,21 @@ class SecurityValidator(BaseValidator):
                 }
             )
             
-            found_patterns = []
-            pattern_locations = {}
+            pattern_locations = self._find_patterns(content)
+            found_patterns = [p for p in self.suspicious_patterns if p in pattern_locations]
             
-            for pattern in self.suspicious_patterns:
-                if pattern.lower() in content_lower:
-                    found_patterns.append(pattern)
-                    # Find first occurrence for logging
-                    index = content_lower.find(pattern.lower())
-                    pattern_locations[pattern] = index
-                    
-                    self.logger.warning(
-                        f"Suspicious pattern detected: {pattern}",
-                        extra={
-                            'file_path': str(file_path),
-                            'pattern': pattern,
-                            'location_index': index,
-                            'context': content[max(0, index-20):index+50]
-                        }
-                    )
+            for pattern in found_patterns:
+                index = pattern_locations[pattern]
+                self.logger.warning(
+                    f"Suspicious pattern detected: {pattern}",
+                    extra={
+                        'file_path': str(file_path),
+                        'pattern': pattern,
+                        'location_index': index,
+                        # The surrounding text is sliced only if it gets formatted
+                        'context': _Lazy(lambda c=content, i=index: c[max(0, i-20):i+50])
+                    }
+                )
             
             duration = (time.time() - start_time) * 1000
             
@@ -88,7 +152,7 @@ class SecurityValidator(BaseValidator):
                 return False
             
             self.logger.info(
-                f"Security validation passed",
+                "Security validation passed",
                 extra={
                     'file_path': str(file_path),
                     'patterns_checked': len(self.suspicious_patterns),
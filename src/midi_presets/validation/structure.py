@@ -1,18 +1,25 @@
 from pathlib import Path
-from typing import List
+from typing import List, Union
 import os
+import re
 
 from .base import BaseValidator
+from .context import ValidationContext
 from ..utils.logging import get_logger
 
+# Same as stripping '_' and '-' and calling isalnum(): word characters and
+# hyphens with at least one letter or digit
+_FOLDER_NAME_RE = re.compile(r'[\w-]*[^\W_][\w-]*')
+
 class StructureValidator(BaseValidator):
     def __init__(self, max_depth: int = 4):
         super().__init__()
         self.max_depth = max_depth
         self.logger = get_logger('validation.structure')
     
-    def validate(self, target_path: Path) -> bool:
+    def validate(self, target: Union[Path, ValidationContext]) -> bool:
         """Validate folder structure and hierarchy"""
+        target_path = target.file_path if isinstance(target, ValidationContext) else target
         self.logger.info(
             f"Starting structure validation for {target_path}",
             extra={'file_path': target_path, 'validation_type': 'structure'}
@@ -75,7 +82,7 @@ class StructureValidator(BaseValidator):
             return False
         
         self.logger.info(
-            f"File path validation passed",
+            "File path validation passed",
             extra={'file_path': file_path, 'depth': depth}
         )
         return True
@@ -115,18 +122,15 @@ class StructureValidator(BaseValidator):
             return False
         
         self.logger.info(
-            f"Folder structure validation passed",
+            "Folder structure validation passed",
             extra={'file_path': folder_path, 'depth': depth}
         )
         return True
     
     def _is_valid_folder_name(self, name: str) -> bool:
         """Check if folder name is valid"""
-        if not name:
-            return False
-        
         # Must be alphanumeric with underscore/hyphen
-        return name.replace('_', '').replace('-', '').isalnum()
+        return _FOLDER_NAME_RE.fullmatch(name) is not None
     
     def validate_all_changes(self, changed_paths: List[Path]) -> bool:
         """Validate all changed paths"""
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import pytest
+from pathlib import Path
+
+from midi_presets.checksum.calculator import ChecksumCalculator
+from midi_presets.checksum.manifest import ManifestGenerator
+from midi_presets.utils import jsonio
+
+
+class TestManifestGenerator:
+    @pytest.fixture
+    def nested_devices_folder(self, devices_folder, sample_device_json_bytes):
+        """Add nested folders and files at several depths"""
+        for relative_path in [
+            "test_device/community/b.json",
+            "test_device/community/a.json",
+            "test_device/z.json",
+            "other_device/factory.json",
+            "other_device/nested/deep/x.json",
+        ]:
+            file_path = devices_folder / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(sample_device_json_bytes)
+
+        return devices_folder
+
+    @pytest.mark.parametrize("combiner_algo", ["sha256", "blake2b"])
+    def test_folder_checksums_match_calculator(self, nested_devices_folder, combiner_algo):
+        """Test single-pass folder checksums match per-folder calculation"""
+        generator = ManifestGenerator(nested_devices_folder, jobs=1, combiner_algo=combiner_algo)
+        manifest = generator.generate_manifest()
+        calculator = ChecksumCalculator(combiner_algo=combiner_algo)
+
+        folder_checksums = manifest["folder_checksums"]
+        assert set(folder_checksums) == {
+            "test_device",
+            str(Path("test_device/community")),
+            "other_device",
+            str(Path("other_device/nested")),
+            str(Path("other_device/nested/deep")),
+        }
+
+        for relative_path, folder_hash in folder_checksums.items():
+            assert folder_hash == calculator.calculate_folder_hash(nested_devices_folder / relative_path)
+
+        assert manifest["repository_checksum"] == calculator.calculate_repository_hash(nested_devices_folder)
+        assert len(manifest["file_checksums"]) == 6
+        assert manifest["_repository_metadata"]["combiner_algo"] == combiner_algo
+        assert manifest["_repository_metadata"]["algorithm"] == "sha256"
+
+    def test_parallel_matches_serial(self, nested_devices_folder):
+        """Test manifest generation gives the same checksums with a process pool"""
+        serial = ManifestGenerator(nested_devices_folder, jobs=1, use_cache=False).generate_manifest()
+        parallel = ManifestGenerator(nested_devices_folder, jobs=2, use_cache=False).generate_manifest()
+
+        assert serial["file_checksums"] == parallel["file_checksums"]
+        assert serial["folder_checksums"] == parallel["folder_checksums"]
+        assert serial["repository_checksum"] == parallel["repository_checksum"]
+
+    def test_unchanged_files_reuse_previous_entries(self, nested_devices_folder):
+        """Test regeneration reuses entries for unchanged files and re-analyzes changed ones"""
+        generator = ManifestGenerator(nested_devices_folder, jobs=1)
+        first = generator.generate_manifest()
+        jsonio.dump(first, nested_devices_folder / "_manifest.json", indent=True)
+
+        changed_file = nested_devices_folder / "test_device" / "z.json"
+        with open(changed_file, 'a') as f:
+            f.write("\n")
+
+        generator = ManifestGenerator(nested_devices_folder, jobs=1)
+        reused = generator._reusable_entries(generator._walk_json_files())
+        assert changed_file not in reused
+        assert len(reused) == 5
+
+        second = generator.generate_manifest()
+        changed_key = str(Path("test_device/z.json"))
+        assert second["file_checksums"][changed_key]["sha256"] != first["file_checksums"][changed_key]["sha256"]
+        assert second["statistics"] == first["statistics"]
+        assert second["folder_checksums"]["other_device"] == first["folder_checksums"]["other_device"]
+
+
+class TestChecksumCalculator:
+    def test_verify_file_checks_size_before_hash(self, tmp_path):
+        """Test verification fails on size mismatch and passes on matching size and hash"""
+        calculator = ChecksumCalculator()
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        file_hash = calculator.calculate_file_hash(file_path)
+
+        assert calculator.verify_file(file_path, file_hash, file_path.stat().st_size)
+        assert not calculator.verify_file(file_path, file_hash, file_path.stat().st_size + 1)
+        assert not calculator.verify_file(file_path, "0" * 64)
+        assert not calculator.verify_file(tmp_path / "missing.json", file_hash)
+
+    def test_digest_matches_hex_hash(self, tmp_path):
+        """Test fresh and cached files give the same raw digest as the hex hash"""
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        calculator = ChecksumCalculator(tmp_path / ".checksum_cache.json")
+
+        digest = calculator.calculate_file_digest(file_path)
+        assert digest == hashlib.sha256(file_path.read_bytes()).digest()
+        assert calculator.calculate_file_digest(file_path, file_path.stat()) == digest
+        assert calculator.calculate_file_hash(file_path) == digest.hex()
+
+    def test_cache_round_trip_leaves_no_temp_files(self, tmp_path):
+        """Test saved hashes load back and the cache is replaced in one step"""
+        cache_file = tmp_path / ".checksum_cache.json"
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        calculator = ChecksumCalculator(cache_file)
+        file_hash = calculator.calculate_file_hash(file_path)
+        calculator.save_cache()
+
+        reloaded = ChecksumCalculator(cache_file)
+        assert reloaded.get_cached_hash(file_path, file_path.stat()) == file_hash
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".checksum_cache.json", "file.json"]
+
+
+class TestManifestVerification:
+    def test_verify_rehashes_unless_cache_is_trusted(self, devices_folder):
+        """Test an in-place edit with the same size and mtime fails verification by default"""
+        generator = ManifestGenerator(devices_folder, jobs=1)
+        manifest_path = devices_folder / "_manifest.json"
+        jsonio.dump(generator.generate_manifest(), manifest_path)
+        
+        device_file = devices_folder / "test_device" / "factory.json"
+        st = device_file.stat()
+        content = device_file.read_bytes()
+        device_file.write_bytes(content.replace(b"Test Preset", b"Test Prezet"))
+        os.utime(device_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert not ManifestGenerator(devices_folder, jobs=1).verify_manifest(manifest_path)
+        # Only a trusted cache is fooled by the restored mtime
+        assert ManifestGenerator(devices_folder, jobs=1).verify_manifest(manifest_path, trust_cache=True)
+    
+    def test_verify_leaves_the_generation_cache_alone(self, devices_folder):
+        """Test generating after an untrusted verify still uses and saves the cache"""
+        generator = ManifestGenerator(devices_folder, jobs=1)
+        manifest_path = devices_folder / "_manifest.json"
+        jsonio.dump(generator.generate_manifest(), manifest_path)
+        calculator = generator.calculator
+        
+        assert generator.verify_manifest(manifest_path)
+        assert generator.calculator is calculator
+        assert generator.calculator.cache_file == generator.cache_file
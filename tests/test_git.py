@@ -0,0 +1,17 @@
+import logging
+
+from midi_presets.utils.git import GitUtils
+
+
+class TestGitUtils:
+    def test_repository_check_runs_on_first_query(self, tmp_path, caplog):
+        """Test the not-a-repository warning is logged once, by the first query"""
+        caplog.set_level(logging.DEBUG, logger="midi_presets")
+        git_utils = GitUtils(tmp_path)
+        
+        assert "Not in a git repository" not in caplog.text
+        
+        assert git_utils.get_revision_count() == 0
+        git_utils.get_current_hash()
+        assert caplog.text.count("Not in a git repository or git not available") == 1
+        assert git_utils.is_git_repo is False
@@ -0,0 +1,60 @@
+import json
+import pytest
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+from midi_presets.utils import jsonio
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class TestJsonio:
+    def test_dumps_matches_stdlib_compact_output(self):
+        """Test compact output uses no spaces and keeps non-ASCII text"""
+        data = {"name": "Café", "values": [1, 2.5, None, True], "nested": {"a": []}}
+        
+        assert jsonio.dumps(data) == json.dumps(
+            data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+    
+    def test_dumps_indents_with_two_spaces(self):
+        data = {"a": {"b": [1, 2]}}
+        
+        assert jsonio.dumps(data, indent=True) == json.dumps(data, indent=2).encode("utf-8")
+    
+    def test_dumps_encodes_paths_enums_and_datetimes(self):
+        data = {
+            "path": Path("devices") / "x.json",
+            "color": _Color.RED,
+            "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2),
+        }
+        
+        assert jsonio.loads(jsonio.dumps(data)) == {
+            "path": str(Path("devices") / "x.json"),
+            "color": "red",
+            "when": "2024-01-02T03:04:05+00:00",
+            "day": "2024-01-02",
+        }
+    
+    def test_dumps_rejects_unknown_types(self):
+        with pytest.raises(TypeError):
+            jsonio.dumps({"value": object()})
+    
+    def test_loads_accepts_bytes_and_str(self):
+        assert jsonio.loads(b'{"a": [1]}') == jsonio.loads('{"a": [1]}') == {"a": [1]}
+    
+    def test_decode_errors_are_json_decode_errors(self):
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads(b'{"invalid": json}')
+        with pytest.raises(ValueError):
+            jsonio.loads(b'{"invalid": json}')
+    
+    def test_dump_and_load_round_trip(self, tmp_path, sample_device_data):
+        file_path = tmp_path / "device.json"
+        jsonio.dump(sample_device_data, file_path, indent=True)
+        
+        assert jsonio.load(file_path) == sample_device_data
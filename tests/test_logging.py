@@ -0,0 +1,20 @@
+import logging
+
+from midi_presets.utils.logging import LoggerSetup
+
+
+class TestLoggerSetup:
+    def test_setup_leaves_process_wide_flags_alone(self, monkeypatch):
+        """Test only the entry points turn off thread and process lookups"""
+        monkeypatch.setattr(logging, "logThreads", True)
+        monkeypatch.setattr(logging, "logProcesses", True)
+        monkeypatch.setattr(logging, "logMultiprocessing", True)
+        if hasattr(logging, "logAsyncioTasks"):
+            monkeypatch.setattr(logging, "logAsyncioTasks", True)
+        monkeypatch.setattr(LoggerSetup, "_current_setup", None)
+        
+        LoggerSetup.setup_logging(level="DEBUG", json_format=True)
+        assert logging.logThreads and logging.logProcesses
+        
+        LoggerSetup.skip_record_details()
+        assert not logging.logThreads and not logging.logProcesses
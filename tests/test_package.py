@@ -0,0 +1,48 @@
+import os
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+import midi_presets
+import midi_presets.cli
+import midi_presets.utils
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize("package,name", [
+        (midi_presets, "DeviceModel"),
+        (midi_presets, "ContentValidator"),
+        (midi_presets.cli, "ValidationCLI"),
+        (midi_presets.utils, "GitUtils"),
+    ])
+    def test_lazy_names_are_listed_and_importable(self, package, name):
+        """Test lazy names show up in dir() and resolve on access"""
+        assert name in dir(package)
+        assert getattr(package, name).__name__ == name
+    
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            midi_presets.NotAName
+    
+    def test_main_is_the_entry_point_function(self):
+        """Test the main submodule does not shadow the main function"""
+        import midi_presets.cli.main
+        
+        assert callable(midi_presets.cli.main)
+        from midi_presets.cli import main
+        assert callable(main)
+    
+    def test_package_import_does_not_load_models(self):
+        """Test importing the package leaves pydantic and subprocess unloaded"""
+        code = (
+            "import sys, midi_presets, midi_presets.cli, midi_presets.utils; "
+            "print('pydantic' in sys.modules, 'midi_presets.utils.git' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": str(SRC_DIR)}
+        )
+        assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,144 @@
+import multiprocessing
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from midi_presets.cli import validate as validate_module
+from midi_presets.cli.validate import (
+    ValidationCLI, _create_validators, _init_worker, _validate_one, validate_file
+)
+from midi_presets.utils import jsonio
+from midi_presets.utils.config import ValidationConfig
+from midi_presets.validation.base import BaseValidator
+from midi_presets.validation.context import ValidationContext
+
+
+class TestValidateFile:
+    def test_issues_survive_later_files(self, tmp_path):
+        """Test issues returned for one file are not changed by validating the next"""
+        validators = _create_validators(ValidationConfig())
+        file_paths = []
+        for name in ("a1", "b2", "c3"):
+            file_path = tmp_path / name / f"{name}.json"
+            file_path.parent.mkdir()
+            file_path.write_bytes(b'{"' + name.encode() + b'": json}')
+            file_paths.append(file_path)
+        
+        results = [validate_file(file_path, validators) for file_path in file_paths]
+        
+        for file_path, (file_valid, issues) in zip(file_paths, results):
+            assert not file_valid
+            assert issues
+            assert all(issue.file_path == file_path for issue in issues)
+            assert all(file_path.name in str(issue) for issue in issues)
+
+
+class _CountingValidator(BaseValidator):
+    """Passes every file with one warning, counting the files it sees"""
+    def __init__(self):
+        super().__init__()
+        self.validated = []
+    
+    def validate(self, target):
+        file_path = ValidationContext.of(target).file_path
+        self.validated.append(file_path)
+        self.add_error("looks odd", severity="warning", file_path=file_path)
+        return True
+
+
+class TestSkipUnchanged:
+    @pytest.fixture
+    def device_file(self, tmp_path, sample_device_json_bytes):
+        file_path = tmp_path / "device.json"
+        file_path.write_bytes(sample_device_json_bytes)
+        return file_path
+    
+    def _run(self, tmp_path, file_path, config=None):
+        cli = ValidationCLI(
+            config=config, jobs=1, skip_unchanged=True, cache_file=tmp_path / "cache.json"
+        )
+        validator = _CountingValidator()
+        cli._validators = [validator]
+        assert cli.validate_files([file_path])
+        return validator.validated
+    
+    def test_unchanged_file_is_skipped_with_its_warnings(self, tmp_path, device_file, capsys):
+        """Test a file that passed before is skipped and its warnings reported again"""
+        assert self._run(tmp_path, device_file) == [device_file]
+        capsys.readouterr()
+        
+        assert self._run(tmp_path, device_file) == []
+        output = capsys.readouterr().out
+        assert "is unchanged, skipped" in output
+        assert "looks odd" in output
+    
+    def test_changed_file_is_validated(self, tmp_path, device_file):
+        """Test a file whose content changed is validated again"""
+        self._run(tmp_path, device_file)
+        device_file.write_bytes(device_file.read_bytes() + b"\n")
+        
+        assert self._run(tmp_path, device_file) == [device_file]
+    
+    def test_changed_settings_invalidate_cache(self, tmp_path, device_file):
+        """Test results cached under other validation settings are not reused"""
+        self._run(tmp_path, device_file)
+        
+        assert self._run(tmp_path, device_file, ValidationConfig(strict_mode=True)) == [device_file]
+        assert self._run(tmp_path, device_file, ValidationConfig(max_file_size_mb=1.0)) == [device_file]
+        assert self._run(tmp_path, device_file, ValidationConfig(max_file_size_mb=1.0)) == []
+    
+    def test_changed_code_invalidates_cache(self, tmp_path, device_file, monkeypatch):
+        """Test results cached by another package version are not reused"""
+        self._run(tmp_path, device_file)
+        monkeypatch.setattr(validate_module, "__version__", "0.0.0")
+        
+        assert self._run(tmp_path, device_file) == [device_file]
+
+
+class TestParallelValidation:
+    @pytest.fixture
+    def device_files(self, tmp_path, sample_device_json_bytes, monkeypatch):
+        """Files under a devices folder, as paths relative to the working directory"""
+        monkeypatch.chdir(tmp_path)
+        device_dir = Path("devices") / "test_device"
+        device_dir.mkdir(parents=True)
+        contents = {
+            "factory.json": sample_device_json_bytes,
+            "broken.json": b'{"invalid": json}',
+            "schema.json": b'{"device_info": {}}',
+            "script.json": sample_device_json_bytes.replace(b"Test Preset", b"<script>"),
+        }
+        file_paths = []
+        for name, content in contents.items():
+            (device_dir / name).write_bytes(content)
+            file_paths.append(device_dir / name)
+        return file_paths
+    
+    @staticmethod
+    def _results(cli, file_paths):
+        return [
+            (file_valid, [str(issue) for issue in issues])
+            for file_valid, issues in cli._validate_all(file_paths)
+        ]
+    
+    def test_parallel_matches_serial(self, device_files):
+        """Test validation gives the same results with a process pool"""
+        serial = self._results(ValidationCLI(jobs=1), device_files)
+        parallel = self._results(ValidationCLI(jobs=2), device_files)
+        
+        assert parallel == serial
+        assert [file_valid for file_valid, _ in serial] == [True, False, False, False]
+    
+    def test_spawned_worker_repeats_logging_setup(self, tmp_path, device_files):
+        """Test a spawned worker logs to the parent's log file"""
+        log_file = tmp_path / "validate.log"
+        
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker, initargs=(ValidationConfig(), ("INFO", log_file, True))
+        ) as executor:
+            file_valid, _ = executor.submit(_validate_one, device_files[0]).result()
+        
+        assert file_valid
+        entries = [jsonio.loads(line) for line in log_file.read_text().splitlines()]
+        assert any(entry["message"] == "Starting content validation" for entry in entries)
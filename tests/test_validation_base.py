@@ -0,0 +1,45 @@
+import pytest
+
+from midi_presets.validation.base import BaseValidator, ValidationError
+
+
+class _RecordingValidator(BaseValidator):
+    def validate(self, target):
+        return not self.has_errors()
+
+
+class TestBaseValidator:
+    def test_errors_keeps_insertion_order(self):
+        """Test errors lists every issue in the order it was added"""
+        validator = _RecordingValidator()
+        validator.add_error("first warning", severity="warning")
+        validator.add_error("first error")
+        validator.add_error("note", severity="info")
+        validator.add_error("second error")
+        
+        assert [e.message for e in validator.errors] == ["first warning", "first error", "note", "second error"]
+        assert [e.message for e in validator.get_errors()] == ["first error", "second error"]
+        assert [e.message for e in validator.get_warnings()] == ["first warning"]
+    
+    def test_errors_is_read_only(self):
+        """Test issues can only be recorded through add_error"""
+        validator = _RecordingValidator()
+        validator.add_error("added", severity="warning")
+        
+        with pytest.raises(AttributeError):
+            validator.errors = []
+        validator.errors.append(ValidationError("appended"))
+        assert len(validator.errors) == 1
+        assert not validator.has_errors()
+        assert validator.validate(None)
+    
+    def test_clear_errors_resets_every_view(self):
+        validator = _RecordingValidator()
+        validator.add_error("error")
+        validator.add_error("warning", severity="warning")
+        
+        validator.clear_errors()
+        assert validator.errors == []
+        assert not validator.has_errors()
+        assert not validator.has_warnings()
+        assert validator.get_errors() == []
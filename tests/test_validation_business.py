@@ -0,0 +1,115 @@
+import copy
+import pytest
+from pathlib import Path
+
+from midi_presets.models.device import DeviceModel
+from midi_presets.utils import jsonio
+from midi_presets.validation.business import BusinessRulesValidator
+from midi_presets.validation.content import ContentValidator
+from midi_presets.validation.context import ValidationContext
+
+
+def _context(data, name="device.json"):
+    return ValidationContext.from_bytes(jsonio.dumps(data), Path(name))
+
+
+def _add_preset(collection, preset_id, **fields):
+    """Add a copy of the collection's first preset, with its metadata"""
+    first = collection["presets"][0]
+    collection["presets"].append(dict(copy.deepcopy(first), preset_id=preset_id, **fields))
+    collection["preset_metadata"][preset_id] = copy.deepcopy(
+        collection["preset_metadata"][first["preset_id"]]
+    )
+
+
+@pytest.fixture
+def two_collection_data(sample_device_data):
+    """Two collections sharing one preset ID, with a long name and bad ratings"""
+    data = copy.deepcopy(sample_device_data)
+    default = data["preset_collections"]["default"]
+    _add_preset(
+        default, "p2", cc_0=None, pgm=5, preset_name="Long " * 12,
+        characters=[], user_ratings={"a": 11, "b": 5, "c": "x"}
+    )
+    
+    second = copy.deepcopy(default)
+    second["presets"] = second["presets"][:1]
+    second["preset_metadata"] = {"test_preset_001": second["preset_metadata"]["test_preset_001"]}
+    _add_preset(second, "p3", cc_0=31, pgm=1)
+    data["preset_collections"]["second"] = second
+    return data
+
+
+class TestBusinessRulesValidator:
+    def test_skips_files_that_failed_content_validation(self):
+        """Test no second error is reported for content that already failed"""
+        ctx = ValidationContext.from_bytes(b'{"invalid": json}', Path("bad.json"))
+        assert not ContentValidator().validate(ctx)
+        
+        validator = BusinessRulesValidator()
+        assert not validator.validate(ctx)
+        assert validator.get_errors() == []
+    
+    @pytest.mark.parametrize("raw_bytes", [
+        b'[]',
+        b'"device"',
+        b'{"device_info": 1, "preset_collections": []}',
+        b'[' * 5000 + b']' * 5000,
+    ])
+    def test_unusable_content_is_reported(self, raw_bytes):
+        """Test content that cannot become a device is an error, not an exception"""
+        validator = BusinessRulesValidator()
+        
+        assert not validator.validate(ValidationContext.from_bytes(raw_bytes, Path("x.json")))
+        assert validator.get_errors()[0].message.startswith("Error in business rules validation")
+    
+    def test_unexpected_rule_failure_is_reported(self, sample_device_data, monkeypatch):
+        """Test an exception raised by a rule is recorded as an error"""
+        validator = BusinessRulesValidator()
+        monkeypatch.setattr(validator, "_scan_presets", lambda device: None)
+        
+        assert not validator.validate(_context(sample_device_data))
+        assert validator.get_errors()[0].message.startswith("Error in business rules validation")
+    
+    def test_scan_presets_collects_every_rule_input(self, two_collection_data):
+        """Test one scan gathers IDs, MIDI values, names and integrity counts"""
+        validator = BusinessRulesValidator()
+        scan = validator._scan_presets(DeviceModel.model_validate(two_collection_data))
+        
+        assert scan["ids_by_collection"] == {
+            "default": ["test_preset_001", "p2"],
+            "second": ["test_preset_001", "p3"],
+        }
+        midi_stats = scan["midi_stats"]
+        assert midi_stats["total_presets"] == 4
+        assert midi_stats["cc_0_out_of_range"] == midi_stats["pgm_out_of_range"] == 0
+        assert [value for value in range(128) if midi_stats["cc_0_seen"][value]] == [30, 31]
+        assert [value for value in range(128) if midi_stats["pgm_seen"][value]] == [1, 5]
+        assert scan["midi_range_issues"] == []
+        assert scan["long_names"] == [("p2", "Long " * 12)]
+        assert scan["preset_name_patterns"] == {"test": 3, "long": 1}
+        assert scan["category_distribution"] == {"test": 4}
+        assert scan["integrity_stats"] == {
+            "empty_preset_names": 0,
+            "empty_sendmidi_commands": 0,
+            "missing_characters": 1,
+            "future_dates": 0,
+            "invalid_ratings": 1,
+        }
+    
+    def test_validate_reports_rule_failures(self, two_collection_data):
+        """Test duplicate IDs and consistency problems are reported in order"""
+        two_collection_data["preset_collections"]["second"]["metadata"]["parent_collections"] = ["missing"]
+        validator = BusinessRulesValidator()
+        
+        assert not validator.validate(_context(two_collection_data))
+        assert [error.message for error in validator.get_errors()] == [
+            "Duplicate preset IDs found: test_preset_001",
+            "Collection 'second' references non-existent parent 'missing'",
+        ]
+    
+    def test_validate_valid_device(self, sample_device_data):
+        validator = BusinessRulesValidator()
+        
+        assert validator.validate(_context(sample_device_data))
+        assert validator.errors == []
@@ -1,82 +1,93 @@
 import pytest
-import json
-import tempfile
 from pathlib import Path
 
+from midi_presets.utils import jsonio
 from midi_presets.validation.content import ContentValidator
-from midi_presets.utils.logging import LoggerSetup
+from midi_presets.validation.context import ValidationContext
 
+
+def _valid_file(tmp_path, sample_bytes):
+    valid_file = tmp_path / "valid.json"
+    valid_file.write_bytes(sample_bytes)
+    return valid_file
+
+
+def _invalid_json(tmp_path, sample_bytes):
+    return ValidationContext.from_bytes(b'{"invalid": json}', Path("invalid.json"))
+
+
+def _invalid_schema(tmp_path, sample_bytes):
+    return ValidationContext.from_bytes(jsonio.dumps({"invalid": "schema"}), Path("invalid_schema.json"))
+
+
+def _missing_file(tmp_path, sample_bytes):
+    # Don't create the file
+    return tmp_path / "missing.json"
+
+
+# (target builder, expected result, substring of the first error)
+CASES = [
+    (_valid_file, True, None),
+    (_invalid_json, False, "json"),
+    (_invalid_schema, False, "schema"),
+    (_missing_file, False, "does not exist"),
+]
+CASE_IDS = ["valid", "invalid_json", "invalid_schema", "missing"]
+
+
+# Kept on one xdist worker so the class-scoped validator is built once
+@pytest.mark.xdist_group("content_validator")
 class TestContentValidator:
-    @pytest.fixture(autouse=True)
-    def setup_logging(self):
-        LoggerSetup.setup_logging(level="DEBUG")
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_validator(cls):
+        """One validator with the default limits for the whole class"""
+        return ContentValidator()
     
-    def test_validate_valid_file(self, temp_dir, sample_device_data):
-        """Test validation of a valid JSON file"""
-        validator = ContentValidator()
-        
-        # Create valid file
-        valid_file = temp_dir / "valid.json"
-        with open(valid_file, 'w') as f:
-            json.dump(sample_device_data, f)
+    @pytest.fixture
+    def validator(self, shared_validator):
+        """The shared validator with no issues left from earlier tests"""
+        shared_validator.clear_errors()
+        return shared_validator
+    
+    @pytest.mark.parametrize("build_target,expected_valid,error_substring", CASES, ids=CASE_IDS)
+    def test_validate(self, validator, tmp_path, sample_device_json_bytes,
+                      build_target, expected_valid, error_substring):
+        """Test validation result and first error for each kind of input"""
+        target = build_target(tmp_path, sample_device_json_bytes)
         
-        assert validator.validate(valid_file) == True
-        assert len(validator.get_errors()) == 0
+        assert validator.validate(target) == expected_valid
+        errors = validator.get_errors()
+        if expected_valid:
+            assert len(errors) == 0
+        else:
+            assert len(errors) > 0
+            assert error_substring in errors[0].message.lower()
     
-    def test_validate_file_too_large(self, temp_dir, sample_device_data):
+    def test_validate_file_too_large(self, tmp_path, sample_device_json_bytes):
         """Test validation fails for files that are too large"""
         validator = ContentValidator(max_file_size_mb=0.001)  # Very small limit
         
         # Create large file
-        large_file = temp_dir / "large.json"
-        large_data = sample_device_data.copy()
-        large_data["large_field"] = "x" * 10000  # Make it large
-        
-        with open(large_file, 'w') as f:
-            json.dump(large_data, f)
+        large_file = tmp_path / "large.json"
+        # Add a large field before the closing brace
+        large_file.write_bytes(
+            sample_device_json_bytes[:-1] + b',"large_field":"' + b"x" * 10000 + b'"}'
+        )
+        assert large_file.stat().st_size > validator.max_file_size_mb * 1024 * 1024
         
-        assert validator.validate(large_file) == False
+        assert not validator.validate(large_file)
         errors = validator.get_errors()
         assert len(errors) > 0
         assert "exceeds" in errors[0].message.lower()
     
-    def test_validate_invalid_json(self, temp_dir):
-        """Test validation fails for invalid JSON"""
-        validator = ContentValidator()
+    def test_validate_file_too_large_is_not_read(self, tmp_path):
+        """Test an oversized file is rejected from its size without being read"""
+        validator = ContentValidator(max_file_size_mb=0.001)
+        large_file = tmp_path / "large.json"
+        large_file.write_bytes(b" " * 2048)
+        ctx = ValidationContext(large_file)
         
-        # Create invalid JSON file
-        invalid_file = temp_dir / "invalid.json"
-        with open(invalid_file, 'w') as f:
-            f.write('{"invalid": json}')  # Invalid JSON
-        
-        assert validator.validate(invalid_file) == False
-        errors = validator.get_errors()
-        assert len(errors) > 0
-        assert "json" in errors[0].message.lower()
-    
-    def test_validate_invalid_schema(self, temp_dir):
-        """Test validation fails for invalid schema"""
-        validator = ContentValidator()
-        
-        # Create file with invalid schema
-        invalid_file = temp_dir / "invalid_schema.json"
-        invalid_data = {"invalid": "schema"}
-        
-        with open(invalid_file, 'w') as f:
-            json.dump(invalid_data, f)
-        
-        assert validator.validate(invalid_file) == False
-        errors = validator.get_errors()
-        assert len(errors) > 0
-        assert "schema" in errors[0].message.lower()
-    
-    def test_validate_missing_file(self, temp_dir):
-        """Test validation fails for missing file"""
-        validator = ContentValidator()
-        
-        missing_file = temp_dir / "missing.json"
-        # Don't create the file
-        
-        assert validator.validate(missing_file) == False
-        errors = validator.get_errors()
-        assert len(errors) > 0
+        assert not validator.validate(ctx)
+        assert "exceeds" in validator.get_errors()[0].message.lower()
+        assert 'raw_bytes' not in ctx.__dict__
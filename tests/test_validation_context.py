@@ -0,0 +1,55 @@
+import pytest
+from pathlib import Path
+
+from midi_presets.models.device import DeviceModel
+from midi_presets.utils import jsonio
+from midi_presets.validation.context import ValidationContext
+
+
+class TestValidationContext:
+    def test_each_stage_is_computed_once(self, tmp_path, sample_device_json_bytes):
+        """Test the file is read and parsed once, however often it is asked for"""
+        file_path = tmp_path / "device.json"
+        file_path.write_bytes(sample_device_json_bytes)
+        ctx = ValidationContext(file_path)
+        
+        assert ctx.file_size == len(sample_device_json_bytes)
+        raw_bytes = ctx.raw_bytes
+        json_obj = ctx.json_obj
+        device_model = ctx.device_model
+        
+        # Later changes to the file are not seen
+        file_path.write_bytes(b"{}")
+        assert ctx.raw_bytes is raw_bytes
+        assert ctx.json_obj is json_obj
+        assert ctx.device_model is device_model
+        assert ctx.file_size == len(sample_device_json_bytes)
+        assert isinstance(device_model, DeviceModel)
+        assert ctx.text == sample_device_json_bytes.decode("utf-8")
+    
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test every access to a failing stage raises again"""
+        ctx = ValidationContext(tmp_path / "missing.json")
+        
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError):
+                ctx.raw_bytes
+        
+        ctx = ValidationContext.from_bytes(b'{"invalid": json}', Path("bad.json"))
+        for _ in range(2):
+            with pytest.raises(jsonio.JSONDecodeError):
+                ctx.json_obj
+    
+    def test_from_bytes_never_opens_the_file(self, sample_device_data):
+        """Test in-memory content is parsed under the given name without a file"""
+        ctx = ValidationContext.from_bytes(jsonio.dumps(sample_device_data), Path("nowhere/device.json"))
+        
+        assert ctx.file_path == Path("nowhere/device.json")
+        assert ctx.json_obj == sample_device_data
+        assert ctx.device_model.device_info.name == "Test Device"
+    
+    def test_of_wraps_paths_only(self, tmp_path):
+        ctx = ValidationContext(tmp_path)
+        
+        assert ValidationContext.of(ctx) is ctx
+        assert ValidationContext.of(tmp_path).file_path == tmp_path
@@ -0,0 +1,74 @@
+import pytest
+import random
+import re
+from pathlib import Path
+
+from midi_presets.validation.context import ValidationContext
+from midi_presets.validation.security import SecurityValidator, _WINDOW_SIZE
+
+
+def _regex_locations(validator, content):
+    """First occurrence of each pattern per a case-insensitive regex scan"""
+    pattern_re = re.compile(
+        '(?=' + '|'.join(f'({re.escape(p)})' for p in validator.suspicious_patterns) + ')',
+        re.IGNORECASE
+    )
+    locations = {}
+    for match in pattern_re.finditer(content):
+        locations.setdefault(validator.suspicious_patterns[match.lastindex - 1], match.start())
+        if validator.fail_fast:
+            break
+    return locations
+
+
+class TestSecurityValidator:
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    @pytest.mark.parametrize("content", [
+        '{"name": "clean"}',
+        '{"a": "EVAL(1)", "b": "document.x"}',
+        '{"a": "retrieval(x)", "b": "<IFRAMEval("}',
+        # Characters IGNORECASE equates with ASCII letters
+        '{"a": "ſetTimeout", "b": "Kevals", "c": "getattr(İ"}',
+        '{"a": "hısattr(", "b": "HASİATTR(", "c": "hasattr("}',
+        '{"a": "café ß window.open", "b": "javascript:"}',
+    ])
+    def test_find_patterns_matches_regex(self, fail_fast, content):
+        """Test the scan finds what a case-insensitive regex finds, at the same offsets"""
+        validator = SecurityValidator(fail_fast=fail_fast)
+        assert list(validator._find_patterns(content).items()) == \
+            list(_regex_locations(validator, content).items())
+    
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_find_patterns_matches_regex_randomized(self, fail_fast):
+        """Test random mixes of patterns, case changes and look-alike characters"""
+        validator = SecurityValidator(fail_fast=fail_fast)
+        rng = random.Random(0)
+        pieces = validator.suspicious_patterns + ['x', ' ', 'ev', 'al(', 'é', 'ß', 'K']
+        look_alikes = {'s': 'ſ', 'i': 'ıIİ', 'k': 'KK'}
+        
+        for _ in range(500):
+            content = ''
+            for _ in range(rng.randint(0, 8)):
+                for ch in rng.choice(pieces):
+                    if ch.lower() in look_alikes and rng.random() < 0.2:
+                        ch = rng.choice(look_alikes[ch.lower()])
+                    elif rng.random() < 0.3:
+                        ch = ch.upper()
+                    content += ch
+            assert list(validator._find_patterns(content).items()) == \
+                list(_regex_locations(validator, content).items()), content
+    
+    def test_fail_fast_finds_pattern_across_windows(self):
+        """Test a pattern split by the fail_fast window boundary is found"""
+        validator = SecurityValidator(fail_fast=True)
+        content = 'x' * (_WINDOW_SIZE - 3) + 'Eval(1) window.'
+        
+        assert validator._find_patterns(content) == {'eval(': _WINDOW_SIZE - 3}
+    
+    def test_validate_reports_patterns(self):
+        """Test validation fails with the suspicious patterns in the message"""
+        validator = SecurityValidator(fail_fast=False)
+        ctx = ValidationContext.from_bytes('{"a": "é eval(1)", "b": "<script>"}'.encode(), Path("x.json"))
+        
+        assert not validator.validate(ctx)
+        assert validator.get_errors()[0].message == "Contains suspicious patterns: <script, eval("
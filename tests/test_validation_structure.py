@@ -0,0 +1,37 @@
+import pytest
+from pathlib import Path
+
+from midi_presets.validation.context import ValidationContext
+from midi_presets.validation.structure import StructureValidator
+
+
+class TestStructureValidator:
+    @pytest.mark.parametrize("name", [
+        "test_device", "Device-2", "a", "_a_", "-1-", "", "_", "-", "_-_",
+        "a b", "a.b", "café", "ﬁlter", "١٢٣", "ǅevice", "²", "a\\n", "ⅷ",
+    ])
+    def test_folder_name_matches_isalnum_rule(self, name):
+        """Test folder names follow 'alphanumeric once underscores and hyphens are removed'"""
+        expected = name.replace('_', '').replace('-', '').isalnum()
+        
+        assert StructureValidator()._is_valid_folder_name(name) == expected
+    
+    @pytest.mark.parametrize("relative_path,message", [
+        ("devices/test_device/factory.json", None),
+        ("presets/test_device/factory.json", "File must be in devices/ folder"),
+        ("devices/bad name/factory.json", "Invalid folder name 'bad name'"),
+        ("devices/test_device/factory.txt", "Only .json files are allowed"),
+        ("devices/a/b/c/d/e/factory.json", "File exceeds maximum folder depth of 4 levels"),
+    ])
+    def test_validate_file_path(self, tmp_path, monkeypatch, relative_path, message):
+        """Test file locations under devices/ are checked, given a path or a context"""
+        monkeypatch.chdir(tmp_path)
+        file_path = Path(relative_path)
+        file_path.parent.mkdir(parents=True)
+        file_path.write_bytes(b"{}")
+        
+        for target in (file_path, ValidationContext(file_path)):
+            validator = StructureValidator()
+            assert validator.validate(target) == (message is None)
+            if message is not None:
+                assert validator.get_errors()[0].message.startswith(message)